@@ -1,85 +1,91 @@
 #!/usr/bin/env python3
 """PreToolUse hook that controls Bash permissions via regex patterns.
 
-Rules are evaluated like .gitignore: all patterns are checked top-to-bottom,
-and the last matching rule wins. If no rule matches, the decision falls
-through to the user (ask).
+Rules are checked top-to-bottom and the first matching rule wins, so
+exceptions must be listed before the broader rule they override. If no rule
+matches, the decision falls through to the user (ask).
+
+All rule patterns are fused into a single regex that stops at the first
+rule that hits; see ``fused_patterns.fuse_patterns`` for the constraints
+this puts on patterns (no ``r<N>`` groups, global inline flags or numbered
+backreferences).
 """
 
 import json
 import re
 import sys
+from typing import NamedTuple, TypedDict
 
-from typing import Literal
+from fused_patterns import first_match, fuse_patterns
 
-from pydantic import BaseModel, ValidationError
+ALLOW_REASON = "Auto-allowed: command matches allowlist"
 
 
-class Allow(BaseModel):
-    action: Literal["allow"] = "allow"
-    pattern: str
-    reason: str = "Auto-allowed: command matches allowlist"
-
-
-class Deny(BaseModel):
-    action: Literal["deny"] = "deny"
-    pattern: str
-    reason: str = "Denied: command matches denylist"
+class Rule(NamedTuple):
+    pattern: re.Pattern[str]
+    is_allow: bool = True
+    reason: str = ALLOW_REASON
 
 
 # ---------------------------------------------------------------------------
-# Configuration: rules evaluated top-to-bottom, last match wins
+# Configuration: rules evaluated top-to-bottom, first match wins
 # ---------------------------------------------------------------------------
 
-RULES: list[Allow | Deny] = [
+RULES: list[Rule] = [
+    # tmp scripts are allowed (overrides the python deny below)
+    Rule(re.compile(r"^uv run (python )?(\./)?tmp/\S+\.py\b")),
+    # Block all other python invocations
+    Rule(
+        re.compile(r"(^|\b)python3?\b"),
+        is_allow=False,
+        reason="Denied: use lup-devtools instead, or create a script in ./tmp/.",
+    ),
     # Safe read-only / common commands
-    Allow(pattern=r"^ls\b"),
-    Allow(pattern=r"^tree\b"),
-    Allow(pattern=r"^grep\b"),
-    Allow(pattern=r"|\sxargs\b"),
-    Allow(pattern=r"^test "),
-    Allow(pattern=r"^find"),
+    Rule(re.compile(r"^ls\b")),
+    Rule(re.compile(r"^tree\b")),
+    Rule(re.compile(r"^grep\b")),
+    Rule(re.compile(r"|\sxargs\b")),
+    Rule(re.compile(r"^test ")),
+    Rule(re.compile(r"^find")),
     # GitHub CLI (read-only)
-    Allow(pattern=r"^gh (pr|issue) (list|view|diff|status)\b"),
+    Rule(re.compile(r"^gh (pr|issue) (list|view|diff|status)\b")),
     # Git (safe subset)
-    Allow(
-        pattern=r"^git (status|log|diff|show|branch|worktree|stash|remote|fetch|tag|add|commit)\b"
+    Rule(
+        re.compile(
+            r"^git (status|log|diff|show|branch|worktree|stash|remote|fetch|tag|add|commit)\b"
+        )
     ),
     # uv package management
-    Allow(pattern=r"^uv (sync|add|remove|lock)\b"),
-    Allow(pattern=r"^uv run (pyright|pytest|ruff)\b"),
-    Allow(pattern=r"^uv run \S+ --help$"),
+    Rule(re.compile(r"^uv (sync|add|remove|lock)\b")),
+    Rule(re.compile(r"^uv run (pyright|pytest|ruff)\b")),
+    Rule(re.compile(r"^uv run \S+ --help$")),
     # lup-devtools CLI
-    Allow(pattern=r"uv run lup-devtools\b"),
-    # Block all python invocations...
-    Deny(
-        pattern=r"(^|\b)python3?\b",
-        reason="Denied: use lup-devtools instead, or create a script in ./tmp/.",
-    ),
-    # ...except tmp scripts (overrides the deny above)
-    Allow(pattern=r"^uv run (python )?(\./)?tmp/\S+\.py\b"),
+    Rule(re.compile(r"uv run lup-devtools\b")),
 ]
 
 # ---------------------------------------------------------------------------
 # Hook implementation
 # ---------------------------------------------------------------------------
 
+
+RULES_RE = fuse_patterns([rule.pattern for rule in RULES])
+
 HookOutput = dict[str, dict[str, str]]
 
 
-class BashInput(BaseModel):
-    command: str = ""
-    description: str = ""
-    timeout: int | None = None
-    run_in_background: bool = False
+class BashInput(TypedDict, total=False):
+    command: str
+    description: str
+    timeout: int | None
+    run_in_background: bool
 
 
-class HookEvent(BaseModel):
-    tool_name: str = ""
-    tool_input: BashInput = BashInput()
+class HookEvent(TypedDict, total=False):
+    tool_name: str
+    tool_input: BashInput
 
 
-def _allow(reason: str = "Auto-allowed: command matches allowlist") -> HookOutput:
+def _allow(reason: str = ALLOW_REASON) -> HookOutput:
     return {
         "hookSpecificOutput": {
             "hookEventName": "PreToolUse",
@@ -101,30 +107,28 @@ def _deny(reason: str) -> HookOutput:
 
 def decide(command: str) -> HookOutput | None:
     cmd = command.strip()
-    result: HookOutput | None = None
-
-    for rule in RULES:
-        if re.search(rule.pattern, cmd):
-            if rule.action == "allow":
-                result = _allow(rule.reason)
-            else:
-                result = _deny(rule.reason)
+    index = first_match(RULES_RE, cmd)
+    if index is None:
+        return None
 
-    return result
+    rule = RULES[index]
+    if rule.is_allow:
+        return _allow(rule.reason)
+    return _deny(rule.reason)
 
 
 def main() -> None:
     try:
-        event = HookEvent.model_validate_json(sys.stdin.read())
-    except (ValidationError, OSError):
+        event: HookEvent = json.loads(sys.stdin.buffer.read())
+    except (ValueError, OSError):
         sys.exit(0)
 
-    if event.tool_name != "Bash":
+    if not isinstance(event, dict) or event.get("tool_name") != "Bash":
         sys.exit(0)
 
-    result = decide(event.tool_input.command)
+    result = decide(event.get("tool_input", {}).get("command", ""))
     if result:
-        json.dump(result, sys.stdout)
+        sys.stdout.write(json.dumps(result))
 
 
 if __name__ == "__main__":
@@ -12,24 +12,23 @@ Decision order:
 3. Edit introduces `# claude: ignore` -> ask (user prompt)
 4. Pure deletion (new_string is empty) -> allow
 5. replace_all: allow
-6. Count nontrivial added lines per change block (using a state machine
-   for context-aware classification) -> allow if every block <= MAX_REAL_CHANGES
+6. Count nontrivial added lines per block of lines absent from old_string
+   (using a state machine for context-aware classification) -> allow if
+   every block <= MAX_REAL_CHANGES
 """
 
-import difflib
 import json
 import re
 import sys
-
-from pydantic import BaseModel, ValidationError
+from typing import TypedDict
 
 MAX_REAL_CHANGES = 3
 
-PROTECTED_PATTERNS = [
-    r"(^|/)\.claude/",
-    r"(^|/)pyproject\.toml$",
-    r"(^|/)\.env($|\.)",
-]
+PROTECTED_RE = re.compile(
+    r"(^|/)\.claude/"
+    r"|(^|/)pyproject\.toml$"
+    r"|(^|/)\.env($|\.)"
+)
 
 CLAUDE_IGNORE_MARKER = "# claude: ignore"
 
@@ -99,7 +98,7 @@ ANTI_PATTERNS: list[tuple[re.Pattern[str], str]] = [
 
 
 def is_protected_file(file_path: str) -> bool:
-    return any(re.search(p, file_path) for p in PROTECTED_PATTERNS)
+    return PROTECTED_RE.search(file_path) is not None
 
 
 def has_file_level_ignore(file_path: str) -> bool:
@@ -117,6 +116,10 @@ def has_file_level_ignore(file_path: str) -> bool:
 
 
 STRING_PREFIX_RE = re.compile(r"^[fFbBrRuU]*")
+# Comments, imports, bare `pass`, and type annotations / field definitions
+# (name: Type, name: Type = value), matched against the stripped line.
+TRIVIAL_LINE_RE = re.compile(r"#|(?:import|from) |pass$|\w+\s*:\s*\S")
+TYPE_DEF_RE = re.compile(r"(\s*)class\s+\w+\s*\(.*(?:TypedDict|BaseModel).*\)\s*:")
 
 
 def is_string_literal(stripped: str) -> bool:
@@ -142,21 +145,18 @@ def is_trivial_content(stripped: str) -> bool:
     # Non-alpha lines: ), ], }, ):, etc.
     if not any(c.isalpha() for c in stripped):
         return True
-    if stripped.startswith("#"):
-        return True
-    if stripped.startswith(("import ", "from ")):
-        return True
-    if stripped == "pass":
-        return True
-    if is_string_literal(stripped):
-        return True
-    # Type annotations / field definitions: name: Type, name: Type = value
-    if re.match(r"^\w+\s*:\s*\S", stripped):
+    if TRIVIAL_LINE_RE.match(stripped):
         return True
-    return False
+    return is_string_literal(stripped)
 
 
 def classify_trivial(lines: list[str]) -> list[bool]:
+    # Docstrings, parenthesised imports and type definitions all need a
+    # triple quote or "(" — without them every line is classified alone.
+    text = "\n".join(lines)
+    if "(" not in text and '"""' not in text and "'''" not in text:
+        return [is_trivial_content(line.strip()) for line in lines]
+
     result: list[bool] = []
     in_docstring = False
     docstring_delim = ""
@@ -200,9 +200,7 @@ def classify_trivial(lines: list[str]) -> list[bool]:
             if in_type_def and stripped and indent <= type_def_indent:
                 in_type_def = False
 
-            m = re.match(
-                r"(\s*)class\s+\w+\s*\(.*(?:TypedDict|BaseModel).*\)\s*:", line
-            )
+            m = TYPE_DEF_RE.match(line)
             if m:
                 in_type_def = True
                 type_def_indent = len(m.group(1))
@@ -218,64 +216,55 @@ def classify_trivial(lines: list[str]) -> list[bool]:
 def count_real_additions(old_string: str, new_string: str) -> int:
     """Return the max nontrivial addition count across change blocks.
 
-    Consecutive insert/replace/delete opcodes form a single block.
-    Each block is checked independently, so multiple small changes
-    scattered through the diff are each allowed up to MAX_REAL_CHANGES.
+    A new line counts as added when its stripped text does not occur
+    anywhere in the old string, so the check is a linear set lookup rather
+    than a full diff. Consecutive added lines form a single block. Each
+    block is checked independently, so multiple small changes scattered
+    through the edit are each allowed up to MAX_REAL_CHANGES.
     """
-    old_lines = old_string.splitlines() if old_string else []
-    new_lines = new_string.splitlines() if new_string else []
-
-    matcher = difflib.SequenceMatcher(
-        None,
-        [ln.strip() for ln in old_lines],
-        [ln.strip() for ln in new_lines],
-    )
+    if old_string == new_string:
+        return 0
 
+    old_set = {ln.strip() for ln in old_string.splitlines()}
+    new_lines = new_string.splitlines()
     trivial = classify_trivial(new_lines)
 
     max_nontrivial = 0
-    current_block: set[int] = set()
-
-    for tag, _i1, _i2, j1, j2 in matcher.get_opcodes():
-        if tag in ("insert", "replace"):
-            current_block.update(range(j1, j2))
-        elif tag == "equal":
-            if current_block:
-                n = sum(1 for j in current_block if not trivial[j])
-                max_nontrivial = max(max_nontrivial, n)
-                current_block = set()
-        # "delete" doesn't add indices but doesn't break the block
+    current = 0
 
-    if current_block:
-        n = sum(1 for j in current_block if not trivial[j])
-        max_nontrivial = max(max_nontrivial, n)
+    for j, line in enumerate(new_lines):
+        if line.strip() not in old_set:
+            if not trivial[j]:
+                current += 1
+        elif current:
+            max_nontrivial = max(max_nontrivial, current)
+            current = 0
 
-    return max_nontrivial
+    return max(max_nontrivial, current)
 
 
 AllowDecision = dict[str, dict[str, str]]
 
 
-class EditInput(BaseModel):
-    file_path: str = ""
-    old_string: str = ""
-    new_string: str = ""
-    replace_all: bool = False
+class EditInput(TypedDict, total=False):
+    file_path: str
+    old_string: str
+    new_string: str
+    replace_all: bool
 
 
-class HookEvent(BaseModel):
-    tool_name: str = ""
-    tool_input: EditInput = EditInput()
+class HookEvent(TypedDict, total=False):
+    tool_name: str
+    tool_input: EditInput
 
 
-def allow_decision() -> AllowDecision:
-    return {
-        "hookSpecificOutput": {
-            "hookEventName": "PreToolUse",
-            "permissionDecision": "allow",
-            "permissionDecisionReason": "Auto-allowed: safe edit pattern detected",
-        }
+ALLOW_DECISION: AllowDecision = {
+    "hookSpecificOutput": {
+        "hookEventName": "PreToolUse",
+        "permissionDecision": "allow",
+        "permissionDecisionReason": "Auto-allowed: safe edit pattern detected",
     }
+}
 
 
 def deny_decision(reason: str) -> AllowDecision:
@@ -311,6 +300,10 @@ def find_anti_pattern_violations(
     if file_path and has_file_level_ignore(file_path):
         return ("allow", "File has `# claude: ignore` marker")
 
+    # Only non-empty .py edits outside protected paths get here; every other
+    # Edit event exits without paying for the difflib import
+    import difflib
+
     old_lines = old_string.splitlines() if old_string else []
     new_lines = new_string.splitlines() if new_string else []
 
@@ -346,10 +339,10 @@ def find_anti_pattern_violations(
 
 
 def decide(tool_input: EditInput) -> AllowDecision | None:
-    file_path = tool_input.file_path
-    old_string = tool_input.old_string
-    new_string = tool_input.new_string
-    replace_all = tool_input.replace_all
+    file_path = tool_input.get("file_path", "")
+    old_string = tool_input.get("old_string", "")
+    new_string = tool_input.get("new_string", "")
+    replace_all = tool_input.get("replace_all", False)
 
     if is_protected_file(file_path):
         return None
@@ -360,7 +353,7 @@ def decide(tool_input: EditInput) -> AllowDecision | None:
             decision, reason = violation
             match decision:
                 case "allow":
-                    return allow_decision()
+                    return ALLOW_DECISION
                 case "ask":
                     return ask_decision(reason)
                 case "deny":
@@ -370,29 +363,33 @@ def decide(tool_input: EditInput) -> AllowDecision | None:
         return ask_decision("Edit introduces `# claude: ignore` — requires user approval")
 
     if old_string and not new_string:
-        return allow_decision()
+        return ALLOW_DECISION
 
     if replace_all:
-        return allow_decision()
+        return ALLOW_DECISION
+
+    # No block can exceed the budget if the whole new string fits in it
+    if len(new_string.splitlines()) <= MAX_REAL_CHANGES:
+        return ALLOW_DECISION
 
     if count_real_additions(old_string, new_string) <= MAX_REAL_CHANGES:
-        return allow_decision()
+        return ALLOW_DECISION
 
     return None
 
 
 def main() -> None:
     try:
-        event = HookEvent.model_validate_json(sys.stdin.read())
-    except (ValidationError, OSError):
+        event: HookEvent = json.loads(sys.stdin.buffer.read())
+    except (ValueError, OSError):
         sys.exit(0)
 
-    if event.tool_name != "Edit":
+    if not isinstance(event, dict) or event.get("tool_name") != "Edit":
         sys.exit(0)
 
-    result = decide(event.tool_input)
+    result = decide(event.get("tool_input", {}))
     if result:
-        json.dump(result, sys.stdout)
+        sys.stdout.write(json.dumps(result))
 
 
 if __name__ == "__main__":
@@ -5,45 +5,55 @@ Decision order:
 1. Check URL against DENY_PATTERNS -> deny with reason
 2. Check URL against ALLOW_PATTERNS -> auto-allow
 3. Fall through -> defer to user (ask)
+
+Each list is fused into a single regex so one match call finds the first
+matching pattern; see ``fused_patterns.fuse_patterns`` for the constraints
+this puts on patterns (no ``r<N>`` groups, global inline flags or numbered
+backreferences).
 """
 
 import json
 import re
 import sys
+from typing import TypedDict
 
-from pydantic import BaseModel, ValidationError
+from fused_patterns import first_match, fuse_patterns
 
 # ---------------------------------------------------------------------------
 # Configuration: edit these lists to control WebFetch permissions
 # ---------------------------------------------------------------------------
 
-ALLOW_PATTERNS: list[str] = [
+ALLOW_PATTERNS: list[re.Pattern[str]] = [
     # Project documentation
-    r"https?://docs\.claude\.com/",
-    r"https?://ai\.pydantic\.dev/",
+    re.compile(r"https?://docs\.claude\.com/"),
+    re.compile(r"https?://ai\.pydantic\.dev/"),
 ]
 
-DENY_PATTERNS: list[tuple[str, str]] = [
+DENY_PATTERNS: list[tuple[re.Pattern[str], str]] = [
     # (pattern, reason)
     # Example:
-    # (r"https?://malicious\.example\.com", "Blocked: known malicious domain"),
+    # (re.compile(r"https?://malicious\.example\.com"), "Blocked: known malicious domain"),
 ]
 
 # ---------------------------------------------------------------------------
 # Hook implementation
 # ---------------------------------------------------------------------------
 
+
+DENY_RE = fuse_patterns([pattern for pattern, _reason in DENY_PATTERNS])
+ALLOW_RE = fuse_patterns(ALLOW_PATTERNS)
+
 HookOutput = dict[str, dict[str, str]]
 
 
-class WebFetchInput(BaseModel):
-    url: str = ""
-    prompt: str = ""
+class WebFetchInput(TypedDict, total=False):
+    url: str
+    prompt: str
 
 
-class HookEvent(BaseModel):
-    tool_name: str = ""
-    tool_input: WebFetchInput = WebFetchInput()
+class HookEvent(TypedDict, total=False):
+    tool_name: str
+    tool_input: WebFetchInput
 
 
 def _allow(reason: str = "Auto-allowed: URL matches allowlist") -> HookOutput:
@@ -56,6 +66,9 @@ def _allow(reason: str = "Auto-allowed: URL matches allowlist") -> HookOutput:
     }
 
 
+ALLOW_OUTPUT = _allow()
+
+
 def _deny(reason: str) -> HookOutput:
     return {
         "hookSpecificOutput": {
@@ -67,29 +80,28 @@ def _deny(reason: str) -> HookOutput:
 
 
 def decide(url: str) -> HookOutput | None:
-    for pattern, reason in DENY_PATTERNS:
-        if re.search(pattern, url):
-            return _deny(reason)
+    deny_index = first_match(DENY_RE, url)
+    if deny_index is not None:
+        return _deny(DENY_PATTERNS[deny_index][1])
 
-    for pattern in ALLOW_PATTERNS:
-        if re.search(pattern, url):
-            return _allow()
+    if first_match(ALLOW_RE, url) is not None:
+        return ALLOW_OUTPUT
 
     return None
 
 
 def main() -> None:
     try:
-        event = HookEvent.model_validate_json(sys.stdin.read())
-    except (ValidationError, OSError):
+        event: HookEvent = json.loads(sys.stdin.buffer.read())
+    except (ValueError, OSError):
         sys.exit(0)
 
-    if event.tool_name != "WebFetch":
+    if not isinstance(event, dict) or event.get("tool_name") != "WebFetch":
         sys.exit(0)
 
-    result = decide(event.tool_input.url)
+    result = decide(event.get("tool_input", {}).get("url", ""))
     if result:
-        json.dump(result, sys.stdout)
+        sys.stdout.write(json.dumps(result))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,33 @@
+"""Shared regex fusion for the auto-allow hooks.
+
+Hooks run as ``python3 <scripts dir>/<hook>.py``, so this sibling module is
+importable from each of them without any packaging.
+"""
+
+import re
+
+
+def fuse_patterns(patterns: list[re.Pattern[str]]) -> re.Pattern[str]:
+    """Fuse patterns into one regex where the first matching pattern wins.
+
+    Each pattern becomes a lookahead that may skip ahead to any position,
+    tried in order as alternatives, so ``match`` stops at the first pattern
+    whose ``search`` would succeed and ``lastgroup`` names it ``r<i>``.
+
+    Patterns must not define groups named ``r<N>`` or use global inline
+    flags such as ``(?i)``. Numbered backreferences (``\\1``) also break:
+    every pattern gains an enclosing group and follows the groups of the
+    patterns before it, so refer back with ``(?P=name)`` to a group name
+    that no other pattern uses.
+    """
+    return re.compile(
+        "|".join(rf"(?=[\s\S]*?(?P<r{i}>{p.pattern}))" for i, p in enumerate(patterns))
+    )
+
+
+def first_match(fused: re.Pattern[str], text: str) -> int | None:
+    """Return the index of the first fused pattern that matches ``text``."""
+    m = fused.match(text)
+    if m is None or m.lastgroup is None:
+        return None
+    return int(m.lastgroup.removeprefix("r"))
@@ -6,15 +6,19 @@ Key patterns:
 1. Multiple env files (.env, .env.local) - local overrides shared
 2. Optional API keys with startup warnings
 3. validation_alias for explicit env var names
-4. Singleton instance for easy import
+4. Lazily built singleton via get_settings()
 
 Usage:
-    from lup.agent.config import settings
-    print(settings.model)
+    from lup.agent.config import get_settings
+    print(get_settings().model)
+
+``from lup.agent.config import settings`` still works and resolves to the
+same instance.
 """
 
 import logging
 import os
+from functools import cache
 from typing import Self
 
 from pydantic import Field, model_validator
@@ -144,12 +148,24 @@ class Settings(BaseSettings):
     )
 
 
-# Singleton instance
-settings = Settings.model_validate({})
+@cache
+def get_settings() -> Settings:
+    """Load settings on first use; later calls return the same instance."""
+    settings = Settings.model_validate({})
+
+    # Route through OpenRouter when the key is set
+    if settings.openrouter_api_key:
+        os.environ.setdefault("ANTHROPIC_BASE_URL", "https://openrouter.ai/api")
+        os.environ.setdefault("ANTHROPIC_AUTH_TOKEN", settings.openrouter_api_key)
+        os.environ.setdefault("ANTHROPIC_API_KEY", "")
+        logger.info("OpenRouter enabled — routing API calls through openrouter.ai")
+
+    return settings
+
 
-# Route through OpenRouter when the key is set
-if settings.openrouter_api_key:
-    os.environ.setdefault("ANTHROPIC_BASE_URL", "https://openrouter.ai/api")
-    os.environ.setdefault("ANTHROPIC_AUTH_TOKEN", settings.openrouter_api_key)
-    os.environ.setdefault("ANTHROPIC_API_KEY", "")
-    logger.info("OpenRouter enabled — routing API calls through openrouter.ai")
+def __getattr__(name: str) -> Settings:
+    # Keeps `from lup.agent.config import settings` working without reading
+    # .env files at import time
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
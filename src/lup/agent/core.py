@@ -18,14 +18,13 @@ from typing import cast
 from claude_agent_sdk import (
     ClaudeAgentOptions,
     ContentBlock,
-    TextBlock,
     ToolUseBlock,
 )
 
 from claude_agent_sdk.types import McpServerConfig, McpSdkServerConfig
 
 from lup.lib.client import query
-from lup.agent.config import settings
+from lup.agent.config import get_settings
 from lup.agent.models import AgentOutput, AgentSessionResult
 from lup.lib.client import TokenUsage
 from lup.agent.prompts import get_system_prompt
@@ -34,7 +33,7 @@ from lup.agent.tool_policy import ToolPolicy
 from lup.agent.tools.example import EXAMPLE_TOOLS
 from lup.agent.tools.reflect import create_reflect_tools
 from lup.version import AGENT_VERSION
-from lup.lib.client import ResponseCollector
+from lup.lib.client import ResponseCollector, json_schema
 from lup.lib.history import save_session
 from lup.lib.hooks import create_permission_hooks, merge_hooks
 from lup.lib.mcp import create_mcp_server, extract_sdk_tools
@@ -46,9 +45,6 @@ from lup.lib.trace import TraceLogger
 
 logger = logging.getLogger(__name__)
 
-NOTES_PATH = Path(settings.notes_path)
-TRACES_PATH = NOTES_PATH / "traces"
-
 
 def build_agent_servers(
     *,
@@ -56,11 +52,13 @@ def build_agent_servers(
     outputs_dir: Path | None = None,
     sandbox: Sandbox | None = None,
     gate: ReflectionGate | None = None,
+    policy: ToolPolicy | None = None,
 ) -> dict[str, McpServerConfig]:
     """Create the agent's core MCP servers, passed through ToolPolicy.
 
-    Creates example, notes (reflect), and optionally sandbox servers,
-    then applies ToolPolicy filtering.
+    Creates example (unless the policy excludes all its tools), notes
+    (reflect), and optionally sandbox servers, then applies ToolPolicy
+    filtering.
 
     Args:
         session_dir: Directory for reflection tool output.
@@ -69,12 +67,18 @@ def build_agent_servers(
             context manager by the caller before calling this).
         gate: External ReflectionGate for the reflect tools to use.
             If None, a new gate is created internally.
+        policy: ToolPolicy to filter with. If None, one is built from
+            settings.
     """
-    example_server = create_mcp_server(
-        name="example",
-        version="1.0.0",
-        tools=extract_sdk_tools(EXAMPLE_TOOLS),
-    )
+    if policy is None:
+        policy = ToolPolicy.from_settings(get_settings())
+
+    # Skip the example server entirely when the policy excludes all its tools
+    example_tools = [
+        t.sdk_tool
+        for t in EXAMPLE_TOOLS
+        if policy.is_tool_available(f"mcp__example__{t.sdk_tool.name}")
+    ]
 
     reflect_kit = create_reflect_tools(
         session_dir=session_dir,
@@ -87,11 +91,15 @@ def build_agent_servers(
         tools=extract_sdk_tools(reflect_kit["tools"]),
     )
 
-    all_servers: list[McpSdkServerConfig] = [example_server, reflect_server]
+    all_servers: list[McpSdkServerConfig] = []
+    if example_tools:
+        all_servers.append(
+            create_mcp_server(name="example", version="1.0.0", tools=example_tools)
+        )
+    all_servers.append(reflect_server)
     if sandbox is not None:
         all_servers.append(sandbox.create_mcp_server())
 
-    policy = ToolPolicy.from_settings(settings)
     return policy.get_mcp_servers(*all_servers)
 
 
@@ -105,12 +113,16 @@ def build_options(
     Separated from run_agent() so the option-building logic can be
     tested and customized independently.
     """
+    settings = get_settings()
+    policy = ToolPolicy.from_settings(settings)
+
     gate = ReflectionGate()
     servers = build_agent_servers(
         session_dir=notes_config.session,
         outputs_dir=notes_config.output.parent,
         sandbox=sandbox,
         gate=gate,
+        policy=policy,
     )
 
     permission_hooks = create_permission_hooks(notes_config.rw, notes_config.ro)
@@ -123,8 +135,6 @@ def build_options(
     )
     hooks = merge_hooks(permission_hooks, gate_hooks)
 
-    policy = ToolPolicy.from_settings(settings)
-
     return ClaudeAgentOptions(
         model=settings.model,
         system_prompt={
@@ -147,22 +157,23 @@ def build_options(
         allowed_tools=policy.get_allowed_tools(),
         output_format={
             "type": "json_schema",
-            "schema": AgentOutput.model_json_schema(),
+            "schema": json_schema(AgentOutput),
         },
     )
 
+SOURCE_TOOLS = frozenset({"WebSearch", "WebFetch"})
+
+
 def extract_sources(blocks: list[ContentBlock]) -> list[str]:
     """Extract source URLs/queries from tool use blocks."""
     sources: list[str] = []
     for block in blocks:
-        if isinstance(block, ToolUseBlock) and block.name in (
-            "WebSearch",
-            "WebFetch",
-        ):
-            if isinstance(block.input, dict):
-                source = block.input.get("url") or block.input.get("query")
-                if source:
-                    sources.append(str(source))
+        if not (isinstance(block, ToolUseBlock) and block.name in SOURCE_TOOLS):
+            continue
+        if isinstance(block.input, dict):
+            source = block.input.get("url") or block.input.get("query")
+            if source:
+                sources.append(str(source))
     return sources
 
 def build_result(
@@ -186,7 +197,7 @@ def build_result(
         agent_version=AGENT_VERSION,
         timestamp=datetime.now().isoformat(),
         output=output,
-        reasoning="".join(b.text for b in collector.blocks if isinstance(b, TextBlock)),
+        reasoning="".join(collector.text_parts),
         sources_consulted=extract_sources(collector.blocks),
         duration_seconds=(result.duration_ms / 1000) if result.duration_ms else None,
         cost_usd=result.total_cost_usd,
@@ -211,14 +222,18 @@ async def run_agent(
     Returns:
         AgentSessionResult with the agent's output and metadata.
     """
+    # One reading so the session id and trace filename agree on the start time
+    started = datetime.now()
     if session_id is None:
-        session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        session_id = started.strftime("%Y%m%d_%H%M%S")
 
     logger.info("Starting session %s", session_id)
     reset_metrics()
 
     notes = setup_notes(session_id, task_id or "0")
-    trace_path = TRACES_PATH / session_id / f"{datetime.now().strftime('%H%M%S')}.md"
+    settings = get_settings()
+    traces_dir = Path(settings.notes_path) / "traces"
+    trace_path = traces_dir / session_id / f"{started.strftime('%H%M%S')}.md"
     trace_logger = TraceLogger(trace_path=trace_path, title=f"Session {session_id}")
 
     # --- Sandbox (optional, requires Docker) ---
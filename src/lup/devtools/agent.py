@@ -42,11 +42,12 @@ if TYPE_CHECKING:
 import sh
 import typer
 
-from lup.agent.config import settings
+from lup.agent.config import get_settings
 from lup.agent.models import AgentOutput
 from lup.agent.prompts import get_system_prompt
 from lup.agent.subagents import get_subagents
 from lup.agent.tools.example import EXAMPLE_TOOLS
+from lup.lib.client import json_schema
 from lup.lib.mcp import LupMcpTool
 
 logger = logging.getLogger(__name__)
@@ -238,13 +239,14 @@ def inspect_cmd(
     all_tools = collect_all_tools()
     subagents = get_subagents()
     prompt = get_system_prompt()
+    settings = get_settings()
 
     if as_json:
         data: dict[str, object] = {
             "model": settings.model,
             "max_thinking_tokens": settings.max_thinking_tokens,
             "tools": [tool_to_dict(t) for t in all_tools],
-            "output_schema": AgentOutput.model_json_schema(),
+            "output_schema": json_schema(AgentOutput),
             "subagents": {
                 name: {
                     "description": agent.description,
@@ -399,7 +401,7 @@ def chat_cmd(
     claude_args: list[str] = []
 
     # Model
-    effective_model = model or settings.model
+    effective_model = model or get_settings().model
     claude_args.extend(["--model", effective_model])
 
     # System prompt
@@ -521,7 +523,7 @@ async def repl(
     from lup.lib.sandbox import Sandbox
 
     console = Console(highlight=False)
-    effective_model = model or settings.model
+    effective_model = model or get_settings().model
 
     mcp_servers: dict[str, McpServerConfig] = {}
     stack = AsyncExitStack()
@@ -531,7 +533,7 @@ async def repl(
         sandbox = Sandbox(
             session_id="repl",
             shared_dir=repl_dir / "sandbox_shared",
-            timeout_seconds=settings.sandbox_timeout_seconds,
+            timeout_seconds=get_settings().sandbox_timeout_seconds,
         )
         stack.enter_context(sandbox)
         mcp_servers = build_agent_servers(
@@ -646,7 +648,7 @@ async def repl(
             async with build_client(
                 model=effective_model,
                 system_prompt=prompt,
-                max_thinking_tokens=settings.max_thinking_tokens or (128_000 - 1),
+                max_thinking_tokens=get_settings().max_thinking_tokens or (128_000 - 1),
                 permission_mode="bypassPermissions",
                 mcp_servers=mcp_servers if mcp_servers else None,
                 agents=get_subagents(),
@@ -15,6 +15,8 @@ Examples::
 import importlib
 import importlib.util
 import inspect
+import itertools
+import os
 from collections.abc import Callable
 from pathlib import Path
 from typing import Annotated, cast
@@ -92,11 +94,12 @@ def inspect_cmd(
     if inspect.ismodule(obj):
         typer.echo(f"\nDocstring:\n{get_docstring(obj)}\n")
 
+        # Static lookup: listing a module must not trigger lazy imports
+        # through a module-level __getattr__
         members = []
-        for member_name in dir(obj):
+        for member_name, member in inspect.getmembers_static(obj):
             if member_name.startswith("_") and not private:
                 continue
-            member = getattr(obj, member_name)
             if inspect.isclass(member):
                 members.append(f"  class {member_name}")
             elif inspect.isfunction(member):
@@ -123,14 +126,23 @@ def inspect_cmd(
             if init_doc != "(no docstring)":
                 typer.echo(f"  {init_doc[:200]}...")
 
+        # Without --help-full only the class's own members are shown, so
+        # read them straight from its __dict__ instead of resolving the MRO,
+        # sorted by name to keep the listing order of dir()
+        if help_full:
+            items = inspect.getmembers(obj)
+        else:
+            items = sorted(vars(obj).items())
+
         methods = []
-        for member_name, member in inspect.getmembers(obj):
+        for member_name, member in items:
             if member_name.startswith("_") and not private:
                 continue
 
-            if not help_full:
-                if member_name not in obj.__dict__:
-                    continue
+            # Bind like attribute access would: staticmethod -> function,
+            # classmethod -> method bound to the class
+            if isinstance(member, (staticmethod, classmethod)):
+                member = member.__get__(None, obj)
 
             if inspect.isfunction(member) or inspect.ismethod(member):
                 sig = format_signature(member, member_name)
@@ -233,19 +245,15 @@ def module_source(
     typer.echo("")
 
     try:
-        content = path.read_text()
-        source_lines = content.splitlines()
-
         start_idx = max(0, start - 1)
+        end_idx = start_idx + lines if lines > 0 else None
 
-        if lines > 0:
-            end_idx = start_idx + lines
-            selected = source_lines[start_idx:end_idx]
-        else:
-            selected = source_lines[start_idx:]
-
-        for i, line in enumerate(selected, start=start_idx + 1):
-            typer.echo(f"{i:4d}  {line}")
+        # Stop reading once the requested range is printed
+        with path.open() as f:
+            selected = itertools.islice(f, start_idx, end_idx)
+            for i, line in enumerate(selected, start=start_idx + 1):
+                text = line.rstrip("\n")
+                typer.echo(f"{i:4d}  {text}")
 
     except OSError as e:
         typer.echo(f"Error reading source: {e}", err=True)
@@ -271,12 +279,15 @@ def module_tree(
 
     typer.echo(f"{package_root}/")
 
-    py_files = sorted(package_root.rglob("*.py"))
-    for py_file in py_files:
-        relative = py_file.relative_to(package_root)
-        depth = len(relative.parts) - 1
-        indent = "  " * depth
-        typer.echo(f"{indent}├── {py_file.name}")
+    # Relative path parts sort the same way as the Path objects would
+    py_files: list[tuple[str, ...]] = []
+    for root, _, files in os.walk(package_root):
+        rel_parts = Path(root).relative_to(package_root).parts
+        py_files.extend((*rel_parts, name) for name in files if name.endswith(".py"))
+
+    for parts in sorted(py_files):
+        indent = "  " * (len(parts) - 1)
+        typer.echo(f"{indent}├── {parts[-1]}")
 
 
 @app.command("module-info")
@@ -20,14 +20,22 @@ Examples::
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Annotated, Any
+from typing import Annotated, Any, NamedTuple
 
 import typer
 from pydantic import BaseModel
 
-from lup.lib.history import iter_session_dirs, resolve_version
+from lup.lib.history import (
+    SessionFile,
+    iter_session_dirs,
+    iter_subdirs,
+    latest_json,
+    resolve_version,
+)
+from lup.lib.metrics import MetricsSummary
 from lup.lib.paths import feedback_path, traces_path
 from lup.version import AGENT_VERSION
 
@@ -83,6 +91,20 @@ class FeedbackMetrics(BaseModel):
     results: list[SessionResult] = []
 
 
+class LoadedSession(NamedTuple):
+    """A session's latest JSON file, with the fields feedback reads pulled out.
+
+    ``data`` keeps the full parsed file; domain-specific fields live under
+    its ``output`` key.
+    """
+
+    session_id: str
+    file: Path
+    timestamp: str
+    tool_metrics: MetricsSummary | None
+    data: SessionFile
+
+
 # =============================================================================
 # CUSTOMIZE THESE FUNCTIONS FOR YOUR DOMAIN
 # =============================================================================
@@ -90,32 +112,57 @@ class FeedbackMetrics(BaseModel):
 
 def load_sessions(
     since: datetime | None = None, version: str | None = None
-) -> list[dict[str, Any]]:
+) -> list[LoadedSession]:
     """Load session data, optionally filtered by version."""
-    sessions: list[dict[str, Any]] = []
+    # Session files are written after their timestamp, so one last
+    # modified before `since` can be skipped without reading it
+    since_ts = since.timestamp() if since else None
 
+    latest_files: list[Path] = []
     for session_dir in iter_session_dirs(version=version):
-        session_files = sorted(session_dir.glob("*.json"), reverse=True)
-        if not session_files:
+        latest = latest_json(session_dir)
+        if latest is None:
+            continue
+        if since_ts is not None and latest.stat().st_mtime < since_ts:
             continue
+        latest_files.append(latest)
 
-        try:
-            data: dict[str, Any] = json.loads(session_files[0].read_text())
-            data["_session_id"] = session_dir.name
-            data["_file"] = str(session_files[0])
+    # Reads are I/O-bound: overlap them, then filter in directory order
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        loaded = list(pool.map(load_session_file, latest_files))
 
-            if since and data.get("timestamp"):
-                session_time = datetime.fromisoformat(data["timestamp"])
-                if session_time < since:
-                    continue
+    sessions: list[LoadedSession] = []
+    for latest, data in zip(latest_files, loaded):
+        if data is None:
+            continue
+
+        timestamp = data.get("timestamp", "")
+        if since and timestamp and datetime.fromisoformat(timestamp) < since:
+            continue
 
-            sessions.append(data)
-        except (json.JSONDecodeError, OSError) as e:
-            logger.warning("Failed to load session %s: %s", session_dir.name, e)
+        sessions.append(
+            LoadedSession(
+                session_id=latest.parent.name,
+                file=latest,
+                timestamp=timestamp,
+                tool_metrics=data.get("tool_metrics"),
+                data=data,
+            )
+        )
 
     return sessions
 
 
+def load_session_file(path: Path) -> SessionFile | None:
+    """Parse one session JSON file, or None if it cannot be read."""
+    try:
+        data: SessionFile = json.loads(path.read_bytes())
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning("Failed to load session %s: %s", path.parent.name, e)
+        return None
+    return data
+
+
 def load_outcomes() -> dict[str, Any]:
     """Load outcome data for sessions.
 
@@ -124,22 +171,21 @@ def load_outcomes() -> dict[str, Any]:
     return {}
 
 
-def match_outcomes(sessions: list[dict[str, Any]]) -> list[SessionResult]:
+def match_outcomes(sessions: list[LoadedSession]) -> list[SessionResult]:
     """Match sessions to their outcomes/feedback."""
     outcomes = load_outcomes()
     results = []
 
+    # Fields come straight from our own loader, so skip per-field validation.
+    # Switch back to SessionResult(...) if you add validators to the model.
     for session in sessions:
-        session_id = session.get("_session_id", "")
-        timestamp = session.get("timestamp", "")
-
-        outcome_data = outcomes.get(session_id)
+        outcome_data = outcomes.get(session.session_id)
 
-        result = SessionResult(
-            session_id=session_id,
-            timestamp=timestamp,
+        result = SessionResult.model_construct(
+            session_id=session.session_id,
+            timestamp=session.timestamp,
             outcome=outcome_data,
-            metrics=session.get("tool_metrics"),
+            metrics=session.tool_metrics,
         )
         results.append(result)
 
@@ -150,7 +196,7 @@ def compute_metrics(results: list[SessionResult]) -> FeedbackMetrics:
     """Compute aggregate metrics from session results."""
     sessions_with_outcomes = sum(1 for r in results if r.outcome is not None)
 
-    return FeedbackMetrics(
+    return FeedbackMetrics.model_construct(
         collection_timestamp=datetime.now().isoformat(),
         total_sessions=len(results),
         sessions_with_outcomes=sessions_with_outcomes,
@@ -204,7 +250,7 @@ def collect(
         since_dt.isoformat() if since_dt else "all time",
     )
 
-    sessions: list[dict[str, Any]] = []
+    sessions: list[LoadedSession] = []
     if effective is None:
         sessions = load_sessions(since_dt)
     else:
@@ -260,7 +306,7 @@ def check(
         print(f"Sessions: {session_count} (all versions in {traces_path()})")
 
     if traces_path().exists():
-        version_count = sum(1 for d in traces_path().iterdir() if d.is_dir())
+        version_count = sum(1 for _ in iter_subdirs(traces_path()))
         print(f"Versions: {version_count} in {traces_path()}")
     else:
         print(f"Traces: No directory at {traces_path()}")
@@ -269,7 +315,7 @@ def check(
         feedback_files = list(feedback_path().glob("*_metrics.json"))
         print(f"Previous feedback collections: {len(feedback_files)}")
         if feedback_files:
-            latest = sorted(feedback_files)[-1]
+            latest = max(feedback_files)
             print(f"  Latest: {latest.name}")
     else:
         print("Previous feedback collections: None")
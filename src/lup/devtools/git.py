@@ -4,21 +4,26 @@ Examples::
 
     $ uv run lup-devtools git commit-results
     $ uv run lup-devtools git commit-results --dry-run
+    $ uv run lup-devtools git commit-results --batch
 """
 
 import json
 import logging
+from functools import cache
 from pathlib import Path
 
 import sh
 import typer
 
-from lup.lib.history import iter_session_dirs
+from lup.lib.history import iter_session_dirs, iter_subdirs, latest_json
 from lup.lib.paths import traces_path
 
 logger = logging.getLogger(__name__)
 app = typer.Typer(no_args_is_help=True)
 
+# Built once; no pty for captured output, which is cheaper to spawn
+git = sh.Command("git").bake("--no-pager", _tty_out=False)
+
 
 def get_uncommitted_session_ids() -> set[str]:
     """Find session IDs with uncommitted result files.
@@ -27,16 +32,26 @@ def get_uncommitted_session_ids() -> set[str]:
         notes/traces/<version>/sessions/<session_id>/...
         notes/traces/<version>/logs/<session_id>/...
     """
-    git = sh.Command("git")
     session_ids: set[str] = set()
 
-    status = str(git.status("--porcelain", "--", "notes/", _ok_code=[0])).strip()
-    if not status:
-        return session_ids
-
-    for line in status.splitlines():
-        file_path = line[3:].split(" -> ")[0].strip()
-        parts = Path(file_path).parts
+    # -z: NUL-separated, paths never quoted. Without rename detection a
+    # move is reported as a deletion plus an addition, one path per entry.
+    # --untracked-files=all: a brand-new version or logs/ directory would
+    # otherwise be collapsed to one entry above the session directories.
+    status = git.status(
+        "--porcelain",
+        "-z",
+        "--no-renames",
+        "--untracked-files=all",
+        "--ignore-submodules",
+        "--",
+        "notes/",
+        _return_cmd=True,
+    ).stdout
+    for entry in status.decode().split("\0"):
+        if len(entry) < 4:
+            continue
+        parts = Path(entry[3:]).parts
 
         # notes/traces/<version>/sessions/<session_id>/...
         # notes/traces/<version>/logs/<session_id>/...
@@ -51,18 +66,21 @@ def get_uncommitted_session_ids() -> set[str]:
     return session_ids
 
 
+@cache
 def get_session_summary(session_id: str) -> str:
-    """Read summary from the latest session JSON across all versions."""
-    all_json: list[Path] = []
-    for session_dir in iter_session_dirs(session_id=session_id):
-        all_json.extend(session_dir.glob("*.json"))
+    """Read summary from the latest session JSON across all versions.
 
-    if not all_json:
+    Cached: session files do not change during a commit-results run.
+    """
+    latest = max(
+        filter(None, map(latest_json, iter_session_dirs(session_id=session_id))),
+        default=None,
+    )
+    if latest is None:
         return f"session {session_id}"
 
-    latest = sorted(all_json)[-1]
     try:
-        data = json.loads(latest.read_text(encoding="utf-8"))
+        data = json.loads(latest.read_bytes())
         output = data.get("output", {})
         if isinstance(output, dict):
             return output.get("summary", f"session {session_id}")[:50]
@@ -71,9 +89,8 @@ def get_session_summary(session_id: str) -> str:
         return f"session {session_id}"
 
 
-def commit_session(session_id: str, *, dry_run: bool = False) -> bool:
-    """Stage and commit files for a single session ID."""
-    git = sh.Command("git")
+def session_paths(session_id: str) -> list[str]:
+    """Collect the session and trace log dirs of a session across versions."""
     paths: list[str] = []
 
     # Find session and log dirs across all versions
@@ -81,13 +98,28 @@ def commit_session(session_id: str, *, dry_run: bool = False) -> bool:
         paths.append(str(session_dir))
 
     # Also check for trace log dirs under each version
-    if traces_path().exists():
-        for ver_dir in traces_path().iterdir():
-            if not ver_dir.is_dir():
-                continue
-            log_dir = ver_dir / "logs" / session_id
-            if log_dir.exists():
-                paths.append(str(log_dir))
+    for ver_dir in iter_subdirs(traces_path()):
+        log_dir = ver_dir / "logs" / session_id
+        if log_dir.exists():
+            paths.append(str(log_dir))
+
+    return paths
+
+
+def session_slug(session_id: str) -> str:
+    """Commit message slug for a session."""
+    return get_session_summary(session_id)[:50].strip().rstrip(".")
+
+
+def has_staged_changes() -> bool:
+    """Whether the index differs from HEAD (exit code only, no diff output)."""
+    diff = git.diff("--cached", "--quiet", _ok_code=[0, 1], _return_cmd=True)
+    return diff.exit_code == 1
+
+
+def commit_session(session_id: str, *, dry_run: bool = False) -> bool:
+    """Stage and commit files for a single session ID."""
+    paths = session_paths(session_id)
 
     if not paths:
         return False
@@ -99,30 +131,69 @@ def commit_session(session_id: str, *, dry_run: bool = False) -> bool:
             print(f"    {p}")
         return True
 
-    for path in paths:
-        try:
-            git.add(path)
-        except sh.ErrorReturnCode as e:
-            logger.warning("Failed to stage %s: %s", path, e)
+    try:
+        git.add("--", *paths)
+    except sh.ErrorReturnCode as e:
+        logger.warning("Failed to stage %s: %s", ", ".join(paths), e)
 
-    diff = str(git.diff("--cached", "--stat", _ok_code=[0, 1])).strip()
-    if not diff:
+    if not has_staged_changes():
         return False
 
-    summary = get_session_summary(session_id)
-    slug = summary[:50].strip().rstrip(".")
+    slug = session_slug(session_id)
     git.commit("-m", f"data(sessions): {slug}")
     print(f"  Committed {session_id}: {slug}")
     return True
 
 
+def commit_batch(session_ids: list[str], *, dry_run: bool = False) -> int:
+    """Stage and commit files for all session IDs in a single commit.
+
+    Returns the number of sessions included in the commit.
+    """
+    by_session = {sid: session_paths(sid) for sid in session_ids}
+    by_session = {sid: paths for sid, paths in by_session.items() if paths}
+
+    if not by_session:
+        return 0
+
+    if dry_run:
+        for session_id, paths in by_session.items():
+            summary = get_session_summary(session_id)
+            print(f"  Would commit {session_id}: {summary}")
+            for p in paths:
+                print(f"    {p}")
+        return len(by_session)
+
+    all_paths = [p for paths in by_session.values() for p in paths]
+    try:
+        git.add("--", *all_paths)
+    except sh.ErrorReturnCode as e:
+        logger.warning("Failed to stage %s: %s", ", ".join(all_paths), e)
+
+    if not has_staged_changes():
+        return 0
+
+    slugs = {sid: session_slug(sid) for sid in by_session}
+    body = "\n".join(f"data(sessions): {slug}" for slug in slugs.values())
+    git.commit("-m", f"data(sessions): {len(slugs)} session(s)", "-m", body)
+    for session_id, slug in slugs.items():
+        print(f"  Committed {session_id}: {slug}")
+    return len(slugs)
+
+
 @app.command("commit-results")
 def commit_results(
     dry_run: bool = typer.Option(
         False, "--dry-run", "-n", help="Show what would be committed"
     ),
+    batch: bool = typer.Option(
+        False, "--batch", "-b", help="Commit all sessions in a single commit"
+    ),
 ) -> None:
-    """Commit all uncommitted session result files, one commit per session."""
+    """Commit all uncommitted session result files.
+
+    One commit per session by default; --batch folds them into one commit.
+    """
     session_ids = get_uncommitted_session_ids()
 
     if not session_ids:
@@ -132,12 +203,18 @@ def commit_results(
     print(f"Found {len(session_ids)} session(s) with uncommitted files")
 
     committed = 0
-    for session_id in sorted(session_ids):
+    if batch:
         try:
-            if commit_session(session_id, dry_run=dry_run):
-                committed += 1
+            committed = commit_batch(sorted(session_ids), dry_run=dry_run)
         except sh.ErrorReturnCode as e:
-            print(f"  Failed {session_id}: {e}")
+            print(f"  Failed batch commit: {e}")
+    else:
+        for session_id in sorted(session_ids):
+            try:
+                if commit_session(session_id, dry_run=dry_run):
+                    committed += 1
+            except sh.ErrorReturnCode as e:
+                print(f"  Failed {session_id}: {e}")
 
     if dry_run:
         print(f"\nWould commit {committed} session(s)")
@@ -13,39 +13,161 @@ Examples::
 """
 
 import json
-from collections import defaultdict
-from typing import Any
+import os
+from collections import Counter, defaultdict
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from typing import NamedTuple, TypedDict
 
 import typer
 
-from lup.lib.history import iter_session_dirs, resolve_version
-from lup.lib.paths import feedback_path
+from lup.lib.history import (
+    FileCache,
+    SessionFile,
+    iter_session_dirs,
+    resolve_version,
+)
+from lup.lib.metrics import ToolMetricsDict
+from lup.lib.paths import feedback_path, project_root
 from lup.version import AGENT_VERSION
 
 app = typer.Typer(no_args_is_help=True)
 
 
-def load_all_sessions(version: str | None = None) -> list[dict[str, Any]]:
-    """Load session files, optionally filtered by agent version."""
-    sessions: list[dict[str, Any]] = []
+class SessionView(NamedTuple):
+    """The fields of a session file that the metrics commands read.
+
+    Built once per file so the commands use attribute access instead of
+    nested ``dict.get`` chains; everything else in the file is dropped.
+    """
+
+    session_id: str
+    file: str
+    timestamp: str
+    has_metrics: bool
+    has_tokens: bool
+    has_outcome: bool
+    cost_usd: float
+    total_cost: float
+    input_tokens: int
+    output_tokens: int
+    total_calls: int
+    total_errors: int
+    by_tool: dict[str, ToolMetricsDict]
+
+
+def session_view(session_id: str, path: str, data: SessionFile) -> SessionView:
+    metrics = data.get("tool_metrics") or {}
+    usage = data.get("token_usage") or {}
+    cost_usd = data.get("cost_usd") or 0
+    return SessionView(
+        session_id=session_id,
+        file=path,
+        timestamp=data.get("timestamp") or "",
+        has_metrics=bool(metrics),
+        has_tokens=bool(usage),
+        has_outcome=data.get("outcome") is not None,
+        cost_usd=cost_usd,
+        total_cost=cost_usd or metrics.get("total_cost_usd") or 0,
+        input_tokens=usage.get("input_tokens") or 0,
+        output_tokens=usage.get("output_tokens") or 0,
+        total_calls=metrics.get("total_tool_calls") or 0,
+        total_errors=metrics.get("total_errors") or 0,
+        by_tool=metrics.get("by_tool") or {},
+    )
+
+
+# Bump when SessionView changes so stale cache entries are discarded
+SESSION_CACHE_VERSION = 1
+
+
+class SessionCacheEntry(TypedDict):
+    """Cached parse of one session file, valid while ``stamp`` still matches.
+
+    ``session`` is a :class:`SessionView` (or None if the file could not be
+    parsed); NamedTuples come back from the JSON cache as plain lists.
+    """
+
+    stamp: list[int]
+    session: Sequence[object] | None
+
 
+def session_cache() -> FileCache[SessionCacheEntry]:
+    """Return the cache of parsed session views, keyed by file path."""
+    return FileCache(
+        project_root() / ".cache" / "metrics_sessions.json", SESSION_CACHE_VERSION
+    )
+
+
+def iter_session_files(
+    version: str | None = None,
+) -> Iterator[tuple[str, str, list[int]]]:
+    """Yield ``(session_id, path, [mtime_ns, size])`` for every session JSON file.
+
+    Uses ``os.scandir`` so file type checks come from the directory entry
+    instead of a separate ``stat`` per file. Files too small to hold a
+    JSON object (empty or truncated writes) are skipped without reading.
+    """
     for session_dir in iter_session_dirs(version=version):
-        for session_file in session_dir.glob("*.json"):
-            try:
-                data: dict[str, Any] = json.loads(session_file.read_text())
-                data["_file"] = str(session_file)
-                data["_session_id"] = session_dir.name
-                sessions.append(data)
-            except (json.JSONDecodeError, OSError):
-                continue
-    return sessions
-
-
-def load_for_versions(versions: list[str] | None) -> list[dict[str, Any]]:
+        with os.scandir(session_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                st = entry.stat()
+                if st.st_size < 2:
+                    continue
+                yield session_dir.name, entry.path, [st.st_mtime_ns, st.st_size]
+
+
+def load_session_file(session_id: str, path: str) -> SessionView | None:
+    """Load one session file as a :class:`SessionView`.
+
+    Returns None if the file cannot be read or parsed.
+    """
+    try:
+        with open(path, "rb") as f:
+            data: SessionFile = json.loads(f.read())
+    except (ValueError, OSError):
+        return None
+    return session_view(session_id, path, data)
+
+
+def load_all_sessions(version: str | None = None) -> list[SessionView]:
+    """Load session files, optionally filtered by agent version.
+
+    Parsed sessions are cached on disk by path and reused while the file's
+    mtime and size are unchanged, so repeated commands only parse new or
+    modified files. Those are read on a thread pool since each read blocks
+    on I/O.
+    """
+    files = list(iter_session_files(version))
+    store = session_cache()
+    cache = store.load()
+
+    stale = [
+        (session_id, path, stamp)
+        for session_id, path, stamp in files
+        if (entry := cache.get(path)) is None or entry["stamp"] != stamp
+    ]
+    if stale:
+        with ThreadPoolExecutor() as pool:
+            loaded = list(
+                pool.map(lambda item: load_session_file(item[0], item[1]), stale)
+            )
+        for (_, path, stamp), session in zip(stale, loaded, strict=True):
+            cache[path] = SessionCacheEntry(stamp=stamp, session=session)
+        store.save(cache)
+
+    sessions = (cache[path]["session"] for _, path, _ in files)
+    return [SessionView._make(session) for session in sessions if session is not None]
+
+
+def load_for_versions(versions: list[str] | None) -> list[SessionView]:
     """Load sessions for a resolved version list (None = all)."""
     if versions is None:
         return load_all_sessions()
-    results: list[dict[str, Any]] = []
+    results: list[SessionView] = []
     for v in versions:
         results.extend(load_all_sessions(version=v))
     return results
@@ -71,33 +193,26 @@ def summary(
         raise typer.Exit(1)
 
     total = len(sessions)
-    with_metrics = sum(1 for s in sessions if s.get("tool_metrics"))
-    with_tokens = sum(1 for s in sessions if s.get("token_usage"))
-    with_outcome = sum(1 for s in sessions if s.get("outcome") is not None)
+    with_metrics = with_tokens = with_outcome = 0
+    total_cost = 0.0
+    total_input = total_output = 0
+    for s in sessions:
+        with_metrics += s.has_metrics
+        with_tokens += s.has_tokens
+        with_outcome += s.has_outcome
+        total_input += s.input_tokens
+        total_output += s.output_tokens
+        total_cost += s.total_cost
 
     typer.echo(f"\n=== Session Summary ({total} total) ===\n")
     typer.echo(f"With metrics: {with_metrics} ({100 * with_metrics / total:.0f}%)")
     typer.echo(f"With tokens:  {with_tokens} ({100 * with_tokens / total:.0f}%)")
     typer.echo(f"With outcome: {with_outcome} ({100 * with_outcome / total:.0f}%)")
 
-    total_cost = 0.0
-    for s in sessions:
-        cost = s.get("cost_usd") or s.get("tool_metrics", {}).get("total_cost_usd", 0)
-        if cost:
-            total_cost += cost
-
     if total_cost > 0:
         typer.echo(f"\nTotal cost: ${total_cost:.2f}")
         typer.echo(f"Avg cost/session: ${total_cost / total:.4f}")
 
-    total_input = 0
-    total_output = 0
-    for s in sessions:
-        usage = s.get("token_usage", {})
-        if usage:
-            total_input += usage.get("input_tokens", 0) or 0
-            total_output += usage.get("output_tokens", 0) or 0
-
     if total_input or total_output:
         typer.echo("\nTokens:")
         typer.echo(f"  Input:  {total_input:,}")
@@ -123,21 +238,19 @@ def tools(
         typer.echo("No sessions found")
         raise typer.Exit(1)
 
-    tool_stats: dict[str, dict[str, int | float]] = defaultdict(
-        lambda: {"calls": 0, "errors": 0, "total_ms": 0}
-    )
+    # One flat counter per field instead of a stats dict per tool
+    tool_calls: Counter[str] = Counter()
+    tool_errors: Counter[str] = Counter()
+    tool_total_ms: defaultdict[str, float] = defaultdict(float)
 
     for s in sessions:
-        metrics = s.get("tool_metrics", {})
-        by_tool = metrics.get("by_tool", {})
-        for tool_name, data in by_tool.items():
-            tool_stats[tool_name]["calls"] += data.get("call_count", 0)
-            tool_stats[tool_name]["errors"] += data.get("error_count", 0)
-            avg_ms = data.get("avg_duration_ms", 0)
+        for tool_name, data in s.by_tool.items():
             count = data.get("call_count", 0)
-            tool_stats[tool_name]["total_ms"] += avg_ms * count
+            tool_calls[tool_name] += count
+            tool_errors[tool_name] += data.get("error_count", 0)
+            tool_total_ms[tool_name] += data.get("avg_duration_ms", 0) * count
 
-    if not tool_stats:
+    if not tool_calls:
         typer.echo("No tool metrics found")
         return
 
@@ -145,16 +258,16 @@ def tools(
     typer.echo(f"{'Tool':<35} {'Calls':>8} {'Errors':>8} {'Err%':>8} {'Avg ms':>10}")
     typer.echo("-" * 75)
 
-    for tool_name in sorted(tool_stats.keys(), key=lambda t: -tool_stats[t]["calls"]):
-        stats = tool_stats[tool_name]
-        calls = int(stats["calls"])
-        errs = int(stats["errors"])
+    rows: list[str] = []
+    for tool_name, calls in tool_calls.most_common():
+        errs = tool_errors[tool_name]
         err_pct = (100 * errs / calls) if calls > 0 else 0
-        avg_ms = stats["total_ms"] / calls if calls > 0 else 0
+        avg_ms = tool_total_ms[tool_name] / calls if calls > 0 else 0
         err_indicator = " !" if err_pct > 10 else ""
-        typer.echo(
+        rows.append(
             f"{tool_name:<35} {calls:>8} {errs:>8} {err_pct:>7.1f}%{err_indicator} {avg_ms:>9.0f}"
         )
+    typer.echo("\n".join(rows))
 
 
 @app.command("errors")
@@ -176,33 +289,25 @@ def errors(
         typer.echo("No sessions found")
         raise typer.Exit(1)
 
-    with_errors: list[dict[str, Any]] = []
-    for s in sessions:
-        metrics = s.get("tool_metrics", {})
-        total_errors = metrics.get("total_errors", 0)
-        if total_errors and total_errors > 0:
-            with_errors.append(
-                {
-                    "session_id": s.get("_session_id"),
-                    "errors": total_errors,
-                    "by_tool": metrics.get("by_tool", {}),
-                }
-            )
+    with_errors = [s for s in sessions if s.total_errors > 0]
 
     if not with_errors:
         typer.echo("No sessions with errors found")
         return
 
-    with_errors.sort(key=lambda x: -x["errors"])
+    with_errors.sort(key=lambda s: -s.total_errors)
 
     typer.echo(f"\n=== Sessions with Errors ({len(with_errors)} total) ===\n")
 
-    for item in with_errors[:limit]:
-        typer.echo(f"Session {item['session_id']}: {item['errors']} errors")
-        for tool_name, tool_data in item["by_tool"].items():
+    rows: list[str] = []
+    for s in with_errors[:limit]:
+        rows.append(f"Session {s.session_id}: {s.total_errors} errors")
+        for tool_name, tool_data in s.by_tool.items():
             errs = tool_data.get("error_count", 0)
             if errs > 0:
-                typer.echo(f"  - {tool_name}: {errs}")
+                rows.append(f"  - {tool_name}: {errs}")
+    if rows:
+        typer.echo("\n".join(rows))
 
 
 @app.command("trends")
@@ -224,8 +329,8 @@ def trends(
         typer.echo("No sessions found")
         raise typer.Exit(1)
 
-    sessions_with_ts = [s for s in sessions if s.get("timestamp")]
-    sessions_with_ts.sort(key=lambda x: x["timestamp"])
+    sessions_with_ts = [s for s in sessions if s.timestamp]
+    sessions_with_ts.sort(key=attrgetter("timestamp"))
 
     if len(sessions_with_ts) < window:
         typer.echo(f"Need at least {window} sessions for trend analysis")
@@ -234,28 +339,36 @@ def trends(
 
     typer.echo(f"\n=== Trends (rolling {window}-session window) ===\n")
 
+    calls = [s.total_calls for s in sessions_with_ts]
+    errs = [s.total_errors for s in sessions_with_ts]
+    costs = [s.cost_usd for s in sessions_with_ts]
+
+    # Sliding sums: add the session entering the window, drop the one leaving
+    total_calls = sum(calls[: window - 1])
+    total_errors = sum(errs[: window - 1])
+    total_cost = sum(costs[: window - 1])
+
+    rows: list[str] = []
     for i in range(window - 1, len(sessions_with_ts)):
-        window_sessions = sessions_with_ts[i - window + 1 : i + 1]
+        total_calls += calls[i]
+        total_errors += errs[i]
+        total_cost += costs[i]
+        if i >= window:
+            total_calls -= calls[i - window]
+            total_errors -= errs[i - window]
+            total_cost -= costs[i - window]
 
-        total_calls = sum(
-            s.get("tool_metrics", {}).get("total_tool_calls", 0)
-            for s in window_sessions
-        )
         avg_calls = total_calls / window
-
-        total_errors = sum(
-            s.get("tool_metrics", {}).get("total_errors", 0) for s in window_sessions
-        )
         error_rate = total_errors / max(1, total_calls)
-
-        total_cost = sum(s.get("cost_usd", 0) or 0 for s in window_sessions)
         avg_cost = total_cost / window
 
-        latest_ts = window_sessions[-1].get("timestamp", "")[:10]
-        typer.echo(
+        latest_ts = sessions_with_ts[i].timestamp[:10]
+        rows.append(
             f"{latest_ts}: calls={avg_calls:.1f}/session, "
             f"errors={error_rate:.1%}, cost=${avg_cost:.4f}/session"
         )
+    if rows:
+        typer.echo("\n".join(rows))
 
 
 @app.command("history")
@@ -274,11 +387,14 @@ def history(
 
     typer.echo("\n=== Feedback Collection History ===\n")
 
+    rows: list[str] = []
     for f in metrics_files[:limit]:
         try:
             data = json.loads(f.read_text())
             total = data.get("total_sessions", 0)
             with_outcomes = data.get("sessions_with_outcomes", 0)
-            typer.echo(f"{f.name}: {total} sessions, {with_outcomes} with outcomes")
+            rows.append(f"{f.name}: {total} sessions, {with_outcomes} with outcomes")
         except (json.JSONDecodeError, OSError):
-            typer.echo(f"{f.name}: (error reading)")
+            rows.append(f"{f.name}: (error reading)")
+    if rows:
+        typer.echo("\n".join(rows))
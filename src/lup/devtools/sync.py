@@ -24,12 +24,15 @@ Examples::
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Annotated
 
 import sh
 import typer
 
+from lup.lib.history import write_atomic
+
 app = typer.Typer(no_args_is_help=True)
 logger = logging.getLogger(__name__)
 
@@ -38,18 +41,23 @@ LOCAL_FILE = Path("downstream.json.local")
 CACHE_DIR = Path(".cache/downstream")
 REFS_DIR = Path("refs")
 
-git = sh.Command("git").bake("--no-pager")
+# No pty for captured output: cheaper to spawn and keeps color codes out
+git = sh.Command("git").bake("--no-pager", _tty_out=False)
 
 
 def load_json(path: Path) -> dict[str, list[dict[str, str]]]:
     if not path.exists():
         return {"projects": []}
-    result: dict[str, list[dict[str, str]]] = json.loads(path.read_text())
+    result: dict[str, list[dict[str, str]]] = json.loads(path.read_bytes())
     return result
 
 
 def save_local(data: dict[str, list[dict[str, str]]]) -> None:
-    LOCAL_FILE.write_text(json.dumps(data, indent=2) + "\n")
+    """Write downstream.json.local atomically, skipping no-op writes."""
+    content = json.dumps(data, indent=2) + "\n"
+    if LOCAL_FILE.exists() and LOCAL_FILE.read_text() == content:
+        return
+    write_atomic(LOCAL_FILE, content)
 
 
 def ensure_ref_symlink(name: str, target: str) -> None:
@@ -172,30 +180,51 @@ def list_projects_cmd() -> None:
         typer.echo("No projects tracked. Check downstream.json or run 'setup'.")
         raise typer.Exit(1)
 
-    print(f"\n{'Project':<20} {'Behind':<10} {'Last Synced':<12} {'Source'}")
-    print("-" * 80)
+    # Clone/fetch sequentially (it prints progress), then count in parallel
+    resolved: dict[str, str] = {}
+    for p in projects:
+        if p.get("ignore"):
+            continue
+        try:
+            resolved[p["name"]] = ensure_local(p)
+        except (typer.Exit, sh.ErrorReturnCode):
+            continue
+
+    # Projects sharing a checkout and sync point need only one rev-list
+    synced_by_name = {p["name"]: p.get("last_synced_commit", "") for p in projects}
+    queries = {name: (path, synced_by_name[name]) for name, path in resolved.items()}
+    unique = list(dict.fromkeys(queries.values()))
+    with ThreadPoolExecutor() as pool:
+        counts = dict(zip(unique, pool.map(lambda q: commit_count(*q), unique)))
+    behind_by_name = {name: counts[query] for name, query in queries.items()}
+
+    rows = [
+        f"\n{'Project':<20} {'Behind':<10} {'Last Synced':<12} {'Source'}",
+        "-" * 80,
+    ]
 
     for p in projects:
         if p.get("ignore"):
-            print(f"{p['name']:<20} {'—':<10} {'ignored':<12} (skipped)")
+            rows.append(f"{p['name']:<20} {'—':<10} {'ignored':<12} (skipped)")
             continue
 
         synced = p.get("last_synced_commit", "")
         synced_short = synced[:8] if synced else "never"
 
-        try:
-            resolved = ensure_local(p)
-        except (typer.Exit, sh.ErrorReturnCode):
+        if p["name"] not in resolved:
             url = p.get("url", "NO PATH")
-            print(f"{p['name']:<20} {'?':<10} {synced_short:<12} {url} (clone failed)")
+            rows.append(
+                f"{p['name']:<20} {'?':<10} {synced_short:<12} {url} (clone failed)"
+            )
             continue
 
-        behind = commit_count(resolved, synced)
+        path = resolved[p["name"]]
+        behind = behind_by_name[p["name"]]
         branch = p.get("branch", "")
-        source = f"{resolved} ({branch})" if branch else resolved
-        print(f"{p['name']:<20} {behind:<10} {synced_short:<12} {source}")
+        source = f"{path} ({branch})" if branch else path
+        rows.append(f"{p['name']:<20} {behind:<10} {synced_short:<12} {source}")
 
-    print()
+    print("\n".join(rows) + "\n")
 
 
 @app.command("log")
@@ -15,30 +15,330 @@ Examples::
     $ uv run lup-devtools trace capabilities
 """
 
+import mmap
+import os
 import re
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
 from pathlib import Path
+from typing import Literal, NamedTuple, TextIO, TypedDict
 
 import typer
 
-from lup.lib.history import iter_session_dirs, iter_trace_log_files, resolve_version
-from lup.lib.paths import traces_path
+from lup.lib.history import (
+    FileCache,
+    iter_session_dirs,
+    iter_trace_log_files,
+    resolve_version,
+)
+from lup.lib.paths import project_root, traces_path
 from lup.version import AGENT_VERSION
 
 app = typer.Typer(no_args_is_help=True)
 
+ERROR_RE = re.compile(
+    rb"error|failed|exception|traceback|couldn't|unable to|not found|timeout",
+    re.IGNORECASE,
+)
+# Lowercase literals at least one of which every ERROR_RE match contains
+ERROR_LITERALS = (
+    b"error",
+    b"failed",
+    b"exception",
+    b"traceback",
+    b"couldn't",
+    b"unable to",
+    b"not found",
+    b"timeout",
+)
+
+# Gaps are bounded so a "need"/"cannot" without its partner backtracks over
+# at most 80 bytes instead of the rest of the line
+CAPABILITY_RE = re.compile(
+    rb"would (?:be useful|have helped|benefit from)"
+    rb"|wish I had|if I could|tool that"
+    rb"|need[^\r\n]{0,80} access to|cannot [^\r\n]{0,80} because",
+    re.IGNORECASE,
+)
+CAPABILITY_LITERALS = (
+    b"would ",
+    b"wish i had",
+    b"if i could",
+    b"tool that",
+    b"need",
+    b"cannot ",
+)
+
+LINE_BREAK_RE = re.compile(rb"[\r\n]")
+
+PARALLEL_MIN_FILES = 32
+
+# Below this size a plain read is cheaper than setting up a mapping
+MMAP_MIN_BYTES = 64 * 1024
+
+# Mapped files are lowercased for the literal probe one chunk at a time
+PROBE_CHUNK_BYTES = 1024 * 1024
+
+
+def contains_any(content: bytes | mmap.mmap, literals: tuple[bytes, ...]) -> bool:
+    """Whether content contains any of the lowercase literals, ignoring ASCII case.
+
+    Lowercasing plus substring search runs at memory speed, an order of
+    magnitude faster than a case-insensitive alternation, so files with no
+    candidate are rejected before the regex sees them.
+    """
+    overlap = max(map(len, literals)) - 1
+    for pos in range(0, len(content), PROBE_CHUNK_BYTES):
+        chunk = content[max(0, pos - overlap) : pos + PROBE_CHUNK_BYTES].lower()
+        if any(literal in chunk for literal in literals):
+            return True
+    return False
+
+
+def matching_spans(
+    regex: re.Pattern[bytes], content: bytes | mmap.mmap
+) -> Iterator[list[int]]:
+    """Yield the ``[start, end]`` byte span of each line regex matches, in order.
+
+    Searches the whole buffer at once instead of line by line, so the
+    pattern must not match across a line break. As with universal
+    newlines, CR, LF and CRLF all end a line.
+    """
+    pos = 0
+    while m := regex.search(content, pos):
+        # Only the gap since the previous match can hold this line's start
+        start = max(
+            content.rfind(b"\n", pos, m.start()),
+            content.rfind(b"\r", pos, m.start()),
+            pos - 1,
+        )
+        brk = LINE_BREAK_RE.search(content, m.end())
+        end = brk.start() if brk else len(content)
+        yield [start + 1, end]
+        pos = end + 1
+
+
+def scan_buffer(
+    regex: re.Pattern[bytes],
+    content: bytes | mmap.mmap,
+    literals: tuple[bytes, ...] = (),
+) -> list[str]:
+    """Decoded matching lines, skipping the regex if no literal occurs."""
+    if literals and not contains_any(content, literals):
+        return []
+    return [
+        content[start:end].decode(errors="replace")
+        for start, end in matching_spans(regex, content)
+    ]
+
+
+@contextmanager
+def file_buffer(path: Path) -> Iterator[bytes | mmap.mmap]:
+    """Yield a file's contents, memory-mapped when it is large.
+
+    Mapped files are served from the page cache without being copied into
+    Python objects.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            yield mm
+
+
+def file_stamp(path: Path) -> list[int] | None:
+    """Return ``[mtime_ns, size]`` for a file, or None if it cannot be stat()ed."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+class FileScan(NamedTuple):
+    """The lines of a file that regex matches, and the stamp they belong to.
+
+    ``stamp`` is taken once the scan is done and is None if the file
+    changed while it was read, so the lines are never cached against a
+    version of the file they did not come from.
+    """
+
+    stamp: list[int] | None
+    lines: list[str]
+
+
+def scan_file(
+    regex: re.Pattern[bytes], path: Path, literals: tuple[bytes, ...] = ()
+) -> FileScan:
+    """Scan one file; no lines and no stamp if it is unreadable."""
+    before = file_stamp(path)
+    try:
+        with file_buffer(path) as content:
+            lines = scan_buffer(regex, content, literals)
+    except OSError:
+        return FileScan(None, [])
+    after = file_stamp(path)
+    return FileScan(after if after == before else None, lines)
+
+
+def grep_files(
+    regex: re.Pattern[bytes], paths: list[Path], literals: tuple[bytes, ...] = ()
+) -> list[FileScan]:
+    """Scan results for each path, in order.
+
+    The scan is CPU-bound, so larger sets of files are spread over worker
+    processes; below PARALLEL_MIN_FILES starting them costs more than it saves.
+    """
+    if len(paths) < PARALLEL_MIN_FILES:
+        return [scan_file(regex, path, literals) for path in paths]
+    with ProcessPoolExecutor() as pool:
+        return list(
+            pool.map(scan_file, repeat(regex), paths, repeat(literals), chunksize=8)
+        )
+
+
+# Bump when ERROR_RE, CAPABILITY_RE, line splitting or the entry layout
+# change so stale cached hits are discarded
+SCAN_CACHE_VERSION = 1
+
+ScanKind = Literal["errors", "capabilities"]
+
+
+class ScanCacheEntry(TypedDict, total=False):
+    """Cached scan state of one trace file.
+
+    The matching lines under each kind are valid while ``stamp``
+    (``[mtime_ns, size]``) still matches the file.
+    """
+
+    stamp: list[int]
+    errors: list[str]
+    capabilities: list[str]
+
+
+def scan_cache() -> FileCache[ScanCacheEntry]:
+    """Return the cache of per-file scan hits, keyed by file path."""
+    return FileCache(project_root() / ".cache" / "trace_scan.json", SCAN_CACHE_VERSION)
+
+
+def cached_grep_files(
+    kind: ScanKind,
+    regex: re.Pattern[bytes],
+    paths: list[Path],
+    literals: tuple[bytes, ...] = (),
+) -> list[list[str]]:
+    """Matching lines for each path, reusing scans cached for unchanged files.
+
+    Each file's matching lines are stored under ``kind`` together with its
+    mtime and size; only files whose stamp differs (or that were never
+    scanned for ``kind``) are scanned again.
+    """
+    store = scan_cache()
+    cache = store.load()
+
+    hits: list[list[str]] = []
+    stale: list[int] = []
+    for i, path in enumerate(paths):
+        entry = cache.get(str(path), {})
+        cached = entry.get(kind)
+        stamp = file_stamp(path)
+        if stamp is not None and entry.get("stamp") == stamp and cached is not None:
+            hits.append(cached)
+        else:
+            hits.append([])
+            stale.append(i)
+
+    if stale:
+        scanned = grep_files(regex, [paths[i] for i in stale], literals)
+        for i, scan in zip(stale, scanned, strict=True):
+            hits[i] = scan.lines
+            if scan.stamp is None:
+                continue
+            entry = cache.get(str(paths[i]), {})
+            if entry.get("stamp") != scan.stamp:
+                entry = ScanCacheEntry(stamp=scan.stamp)
+            entry[kind] = scan.lines
+            cache[str(paths[i])] = entry
+        store.save(cache)
+
+    return hits
+
+
+def iter_trace_files(versions: list[str] | None = None) -> Iterator[Path]:
+    """Yield every .md trace file, optionally only under the given versions."""
+    roots = [traces_path() / v for v in versions] if versions else [traces_path()]
+    for root in roots:
+        if root.exists():
+            yield from root.rglob("*.md")
+
+
+def iter_lines(f: TextIO) -> Iterator[str]:
+    """Yield the lines of a text file without newlines, as str.split("\\n") would.
+
+    A trailing newline therefore produces a final empty line.
+    """
+    line = ""
+    for line in f:
+        yield line.removesuffix("\n")
+    if not line or line.endswith("\n"):
+        yield ""
+
+
+def context_windows(
+    regex: re.Pattern[str], lines: Iterable[str], context: int
+) -> Iterator[tuple[int, list[tuple[int, str]]]]:
+    """Yield (index, window) for each line regex matches, in order.
+
+    The window holds up to ``context`` numbered lines either side of the
+    match. Lines are consumed as a stream, keeping only the last
+    ``2 * context + 1`` of them.
+    """
+    window: deque[tuple[int, str]] = deque(maxlen=2 * context + 1)
+    pending: deque[int] = deque()
+    for j, line in enumerate(lines):
+        window.append((j, line))
+        if regex.search(line):
+            pending.append(j)
+        while pending and pending[0] + context <= j:
+            i = pending.popleft()
+            yield i, [(k, text) for k, text in window if k >= i - context]
+    for i in pending:
+        yield i, [(k, text) for k, text in window if k >= i - context]
+
+
+def dir_usage(path: Path) -> tuple[int, int]:
+    """Return (entry count, total bytes of regular files) for a directory.
+
+    DirEntry.is_file() reads the type scandir already returned, so only
+    the files themselves are stat()ed.
+    """
+    count = size = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            count += 1
+            if entry.is_file():
+                size += entry.stat().st_size
+    return count, size
+
 
 def find_trace(session_id: str) -> Path | None:
     """Find the trace file for a session across all versions."""
     # Check versioned trace logs
-    log_files = list(iter_trace_log_files(session_id=session_id))
-    if log_files:
-        return sorted(log_files)[-1]
+    latest_log = max(iter_trace_log_files(session_id=session_id), default=None)
+    if latest_log:
+        return latest_log
 
     # Check versioned session dirs for .md files
     for session_dir in iter_session_dirs(session_id=session_id):
-        md_files = list(session_dir.glob("*.md"))
-        if md_files:
-            return sorted(md_files)[-1]
+        latest_md = max(session_dir.glob("*.md"), default=None)
+        if latest_md:
+            return latest_md
 
     return None
 
@@ -79,10 +379,12 @@ def show(
     if full:
         typer.echo(content)
     else:
-        lines = content.split("\n")
-        typer.echo("\n".join(lines[:100]))
-        if len(lines) > 100:
-            typer.echo(f"\n... ({len(lines) - 100} more lines)")
+        # Split off only the head; the rest is counted, not materialized
+        head = content.split("\n", 100)[:100]
+        typer.echo("\n".join(head))
+        remaining = content.count("\n") + 1 - len(head)
+        if remaining > 0:
+            typer.echo(f"\n... ({remaining} more lines)")
             typer.echo("Use --full to see complete trace")
 
 
@@ -99,25 +401,17 @@ def search(
     regex = re.compile(pattern, re.IGNORECASE)
     matches_found = 0
 
-    search_paths: list[Path] = list(traces_path().rglob("*.md"))
-
-    for trace_file in search_paths:
+    for trace_file in iter_trace_files():
         try:
-            content = trace_file.read_text(encoding="utf-8")
-            lines = content.split("\n")
-
-            for i, line in enumerate(lines):
-                if regex.search(line):
+            with open(trace_file, encoding="utf-8") as f:
+                for i, window in context_windows(regex, iter_lines(f), context):
                     matches_found += 1
                     typer.echo(
                         f"\n--- {trace_file.relative_to(Path.cwd())}:{i + 1} ---"
                     )
-
-                    start = max(0, i - context)
-                    end = min(len(lines), i + context + 1)
-                    for j in range(start, end):
+                    for j, line in window:
                         prefix = ">>> " if j == i else "    "
-                        typer.echo(f"{prefix}{lines[j]}")
+                        typer.echo(f"{prefix}{line}")
 
         except OSError as e:
             typer.echo(f"Error reading {trace_file}: {e}", err=True)
@@ -140,51 +434,22 @@ def errors(
     if warning:
         typer.echo(warning)
 
-    error_patterns = [
-        r"error",
-        r"failed",
-        r"exception",
-        r"traceback",
-        r"couldn't",
-        r"unable to",
-        r"not found",
-        r"timeout",
-    ]
-
-    regex = re.compile("|".join(error_patterns), re.IGNORECASE)
     errors_by_session: dict[str, list[str]] = {}
 
-    if effective:
-        search_paths: list[Path] = []
-        for v in effective:
-            ver_dir = traces_path() / v
-            if ver_dir.exists():
-                search_paths.extend(ver_dir.rglob("*.md"))
-    else:
-        search_paths = (
-            list(traces_path().rglob("*.md")) if traces_path().exists() else []
-        )
-
-    for trace_file in search_paths:
+    trace_files = list(iter_trace_files(effective))
+    hits = cached_grep_files("errors", ERROR_RE, trace_files, ERROR_LITERALS)
+    for trace_file, error_lines in zip(trace_files, hits):
         try:
-            content = trace_file.read_text(encoding="utf-8")
-
-            try:
-                rel = trace_file.relative_to(traces_path())
-                # Structure: <version>/<logs|sessions>/<session_id>/...
-                session_id = rel.parts[2] if len(rel.parts) > 2 else rel.stem
-            except ValueError:
-                session_id = trace_file.stem
-
-            for line in content.split("\n"):
-                if regex.search(line):
-                    if session_id not in errors_by_session:
-                        errors_by_session[session_id] = []
-                    error_line = line[:100] + "..." if len(line) > 100 else line
-                    errors_by_session[session_id].append(error_line.strip())
+            rel = trace_file.relative_to(traces_path())
+            # Structure: <version>/<logs|sessions>/<session_id>/...
+            session_id = rel.parts[2] if len(rel.parts) > 2 else rel.stem
+        except ValueError:
+            session_id = trace_file.stem
 
-        except OSError:
-            pass
+        if error_lines:
+            errors_by_session.setdefault(session_id, []).extend(
+                line.strip() for line in error_lines
+            )
 
     if not errors_by_session:
         typer.echo("No errors found in traces")
@@ -199,7 +464,8 @@ def errors(
     for session_id, error_lines in sorted_sessions[:limit]:
         typer.echo(f"{session_id}: {len(error_lines)} errors")
         for line in error_lines[:3]:
-            typer.echo(f"  - {line}")
+            short = line if len(line) <= 100 else f"{line[:100]}..."
+            typer.echo(f"  - {short}")
         if len(error_lines) > 3:
             typer.echo(f"  ... and {len(error_lines) - 3} more")
         typer.echo()
@@ -246,44 +512,24 @@ def list_traces(
     typer.echo(f"\n=== Available Traces ({len(unique)} total) ===\n")
 
     for source, session_id, path in sorted(unique, reverse=True)[:limit]:
-        files = list(path.glob("*"))
-        size = sum(f.stat().st_size for f in files if f.is_file())
+        count, size = dir_usage(path)
         size_kb = size / 1024
 
-        typer.echo(f"{session_id} ({source}): {len(files)} files, {size_kb:.1f}KB")
+        typer.echo(f"{session_id} ({source}): {count} files, {size_kb:.1f}KB")
 
 
 @app.command("capabilities")
 def capabilities() -> None:
     """Extract capability requests from traces."""
-    capability_patterns = [
-        r"would be useful",
-        r"would have helped",
-        r"would benefit from",
-        r"wish I had",
-        r"if I could",
-        r"tool that",
-        r"need.* access to",
-        r"cannot .* because",
-    ]
-
-    regex = re.compile("|".join(capability_patterns), re.IGNORECASE)
     requests: list[tuple[str, str]] = []
 
-    search_paths: list[Path] = (
-        list(traces_path().rglob("*.md")) if traces_path().exists() else []
+    trace_files = list(iter_trace_files())
+    hits = cached_grep_files(
+        "capabilities", CAPABILITY_RE, trace_files, CAPABILITY_LITERALS
     )
-
-    for trace_file in search_paths:
-        try:
-            content = trace_file.read_text(encoding="utf-8")
-
-            for line in content.split("\n"):
-                if regex.search(line):
-                    requests.append((str(trace_file), line.strip()))
-
-        except OSError:
-            pass
+    for trace_file, lines in zip(trace_files, hits):
+        for line in lines:
+            requests.append((str(trace_file), line.strip()))
 
     if not requests:
         typer.echo("No capability requests found in traces")
@@ -292,5 +538,5 @@ def capabilities() -> None:
     typer.echo(f"\n=== Capability Requests ({len(requests)} found) ===\n")
 
     for _file_path, request in requests[:30]:
-        request_short = request[:80] + "..." if len(request) > 80 else request
+        request_short = request if len(request) <= 80 else f"{request[:80]}..."
         typer.echo(f"- {request_short}")
@@ -11,13 +11,18 @@ Examples::
     $ uv run lup-devtools usage --watch --interval 300
 """
 
+from __future__ import annotations
+
 import json
 import time
-from datetime import datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Annotated, TypedDict
+from typing import TYPE_CHECKING, Annotated, NamedTuple, TypedDict
+
+if TYPE_CHECKING:
+    import httpx
 
-import httpx
 import typer
 from pydantic import BaseModel, ConfigDict, Field
 from rich.console import Console, Group
@@ -148,13 +153,14 @@ class StatsCache(BaseModel):
 # ── display models ─────────────────────────────────────────
 
 
-class PaceLabel(BaseModel):
+class PaceLabel(NamedTuple):
     word: str
     style: str
 
 
-class DailyBreakdown(BaseModel):
+class DailyBreakdown(NamedTuple):
     date: str
+    day: date
     total_tokens: int
     tokens_by_model: dict[str, int]
     activity: DailyActivity | None
@@ -175,6 +181,21 @@ PACE_LABEL_DEFAULT = PaceLabel(word="heavy usage", style="bold red")
 # ── API ────────────────────────────────────────────────────
 
 
+@lru_cache(maxsize=1)
+def usage_client() -> httpx.Client:
+    """Shared HTTP client, so watch-mode refreshes reuse the TLS connection."""
+    # Imported here: lup-devtools loads this module for every subcommand
+    import httpx
+
+    return httpx.Client(
+        headers={
+            "anthropic-beta": ANTHROPIC_BETA,
+            "Content-Type": "application/json",
+        },
+        timeout=10,
+    )
+
+
 def fetch_usage() -> UsageResponse:
     """Call the live usage API."""
     try:
@@ -185,14 +206,9 @@ def fetch_usage() -> UsageResponse:
         msg = f"Bad credentials file at {CREDS_PATH}: {e}"
         raise RuntimeError(msg) from e
 
-    resp = httpx.get(
+    resp = usage_client().get(
         USAGE_API_URL,
-        headers={
-            "Authorization": f"Bearer {token}",
-            "anthropic-beta": ANTHROPIC_BETA,
-            "Content-Type": "application/json",
-        },
-        timeout=10,
+        headers={"Authorization": f"Bearer {token}"},
     )
     resp.raise_for_status()
     data: UsageResponse = resp.json()
@@ -203,8 +219,20 @@ def fetch_usage() -> UsageResponse:
 
 
 def load_stats() -> StatsCache | None:
-    if not STATS_PATH.exists():
+    try:
+        st = STATS_PATH.stat()
+    except OSError:
         return None
+    return parse_stats(st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=1)
+def parse_stats(mtime_ns: int, size: int) -> StatsCache | None:
+    """Parse stats-cache.json, memoized on its mtime and size.
+
+    Watch mode reloads every interval; the file only changes when Claude Code
+    recomputes it, so most refreshes reuse the previous parse.
+    """
     try:
         return StatsCache.model_validate_json(STATS_PATH.read_bytes())
     except (ValueError, OSError):
@@ -220,39 +248,59 @@ def get_daily_breakdown(
     tokens_by_date = {
         entry.date: entry.tokens_by_model for entry in stats.daily_model_tokens
     }
+    totals_by_date = {
+        entry.date: sum(entry.tokens_by_model.values())
+        for entry in stats.daily_model_tokens
+    }
     activity_by_date = {entry.date: entry for entry in stats.daily_activity}
 
-    days: list[DailyBreakdown] = []
-    d = window_start.date()
-    end = window_end.date()
-    while d <= end:
-        ds = d.isoformat()
-        by_model = tokens_by_date.get(ds, {})
-        days.append(
+    start = window_start.date()
+    days = [
+        start + timedelta(days=i) for i in range((window_end.date() - start).days + 1)
+    ]
+    breakdown: list[DailyBreakdown] = []
+    for day in days:
+        ds = day.isoformat()
+        breakdown.append(
             DailyBreakdown(
                 date=ds,
-                total_tokens=sum(by_model.values()),
-                tokens_by_model=by_model,
+                day=day,
+                total_tokens=totals_by_date.get(ds, 0),
+                tokens_by_model=tokens_by_date.get(ds, {}),
                 activity=activity_by_date.get(ds),
             )
         )
-        d += timedelta(days=1)
-    return days
+    return breakdown
 
 
 # ── formatting helpers ─────────────────────────────────────
 
 
+# (threshold, suffix, decimals), largest first
+TOKEN_UNITS = ((1_000_000, "M", 1), (1_000, "k", 0))
+
+
 def fmt_tokens(n: int) -> str:
-    if n >= 1_000_000:
-        return f"{n / 1_000_000:.1f}M"
-    if n >= 1_000:
-        return f"{n / 1_000:.0f}k"
+    for threshold, suffix, decimals in TOKEN_UNITS:
+        if n >= threshold:
+            return f"{n / threshold:.{decimals}f}{suffix}"
     return str(n)
 
 
-def fmt_countdown(dt: datetime) -> str:
-    total_seconds = (dt - datetime.now(dt.tzinfo)).total_seconds()
+def parse_resets_at(value: str) -> datetime:
+    """Parse an API reset time, reading a missing offset as UTC.
+
+    Renders compare against one aware ``now``, so naive values would not
+    subtract.
+    """
+    resets_at = datetime.fromisoformat(value)
+    if resets_at.tzinfo is None:
+        resets_at = resets_at.replace(tzinfo=UTC)
+    return resets_at
+
+
+def fmt_countdown(dt: datetime, now: datetime) -> str:
+    total_seconds = (dt - now).total_seconds()
     if total_seconds <= 0:
         return "now"
     h = int(total_seconds // 3600)
@@ -284,12 +332,11 @@ def pace_label(ratio: float) -> PaceLabel:
 
 def place_label(text: str, position: int, line_width: int) -> str:
     """Place a text label at a horizontal position in a fixed-width line."""
-    line = [" "] * line_width
-    for j, ch in enumerate(text):
-        pos = position + j
-        if 0 <= pos < line_width:
-            line[pos] = ch
-    return "".join(line)
+    if line_width <= 0:
+        return ""
+    head = min(max(position, 0), line_width)
+    visible = text[head - position : line_width - position]
+    return f"{' ' * head}{visible}".ljust(line_width)
 
 
 # ── rendering ──────────────────────────────────────────────
@@ -298,6 +345,13 @@ def place_label(text: str, position: int, line_width: int) -> str:
 BAR_INDENT = 8  # matches daily bar prefix "  Sa    "
 
 
+def append_fill(out: Text, width: int, filled: int, fill_color: str) -> None:
+    """Append a bar segment: up to ``filled`` solid cells, then empty ones."""
+    filled = min(max(filled, 0), width)
+    out.append("█" * filled, style=fill_color)
+    out.append("░" * (width - filled), style="bright_black")
+
+
 def render_bar(
     out: Text,
     utilization: float,
@@ -313,13 +367,13 @@ def render_bar(
     linear_pos = min(int(linear_frac * bar_width), bar_width - 1)
 
     out.append(" " * BAR_INDENT)
-    for i in range(bar_width):
-        if i == linear_pos:
-            out.append("▎", style="bright_black")
-        elif i < actual_pos:
-            out.append("█", style=fill_color)
-        else:
-            out.append("░", style="bright_black")
+    if 0 <= linear_pos < bar_width:
+        append_fill(out, linear_pos, actual_pos, fill_color)
+        out.append("▎", style="bright_black")
+        rest = bar_width - linear_pos - 1
+        append_fill(out, rest, actual_pos - linear_pos - 1, fill_color)
+    else:
+        append_fill(out, bar_width, actual_pos, fill_color)
     out.append("\n")
 
 
@@ -329,12 +383,12 @@ def render_bucket(
     bucket: UsageBucket,
     window_hours: float,
     bar_width: int,
+    now: datetime,
 ) -> None:
     """Render a usage bucket: label, pacing bar, annotations."""
     utilization = bucket["utilization"]
-    resets_at = datetime.fromisoformat(bucket["resets_at"])
+    resets_at = parse_resets_at(bucket["resets_at"])
     window_start = resets_at - timedelta(hours=window_hours)
-    now = datetime.now(resets_at.tzinfo)
 
     elapsed = (now - window_start).total_seconds()
     total = window_hours * 3600
@@ -346,7 +400,7 @@ def render_bucket(
     out.append(f"  {label}", style="bold bright_white")
     out.append(f"  {utilization:.0f}%", style="bold")
     out.append(f"  ◆ {pace.word}", style=pace.style)
-    out.append(f"  resets in {fmt_countdown(resets_at)}", style="dim")
+    out.append(f"  resets in {fmt_countdown(resets_at, now)}", style="dim")
     out.append("\n")
 
     render_bar(out, utilization, linear_pct, bar_width)
@@ -380,11 +434,7 @@ def render_overage(out: Text, extra: ExtraUsage, bar_width: int) -> None:
     fill_color = pace_color(frac)
     filled = min(int(frac * bar_width), bar_width)
     out.append(" " * BAR_INDENT)
-    for i in range(bar_width):
-        if i < filled:
-            out.append("█", style=fill_color)
-        else:
-            out.append("░", style="bright_black")
+    append_fill(out, bar_width, filled, fill_color)
     out.append("\n\n")
 
 
@@ -393,12 +443,12 @@ def render_daily_breakdown(
     seven_day: UsageBucket,
     stats: StatsCache,
     bar_width: int,
+    now: datetime,
 ) -> None:
     """Render the per-day cost-weighted breakdown within the 7-day window."""
-    resets_at = datetime.fromisoformat(seven_day["resets_at"])
+    resets_at = parse_resets_at(seven_day["resets_at"])
     window_start = resets_at - timedelta(days=7)
-    now = datetime.now(resets_at.tzinfo)
-    today = now.date()
+    today = now.astimezone(resets_at.tzinfo).date()
     today_str = today.isoformat()
 
     daily = get_daily_breakdown(stats, window_start, resets_at)
@@ -482,6 +532,7 @@ def render_daily_breakdown(
                 est_tokens = int(cached_tokens * (1 - cached_frac) / cached_frac)
                 daily[today_idx] = DailyBreakdown(
                     date=today_str,
+                    day=today,
                     total_tokens=est_tokens,
                     tokens_by_model={},
                     activity=daily[today_idx].activity,
@@ -500,14 +551,14 @@ def render_daily_breakdown(
     surplus = 0.0
     daily_budgets: list[float] = []
     for i, day in enumerate(daily):
-        d = datetime.fromisoformat(day.date).date()
+        d = day.day
         budget = even_daily + surplus
         daily_budgets.append(budget)
         if d <= today:
             surplus = budget - daily_weights[i]
 
     for i, day in enumerate(daily):
-        d = datetime.fromisoformat(day.date).date()
+        d = day.day
         day_name = DAY_NAMES[d.weekday()]
 
         if d == today:
@@ -534,17 +585,16 @@ def render_daily_breakdown(
         is_est = i == today_idx and estimated_today
         fill_char = "▓" if is_est else "█"
 
-        for j in range(day_bar_w):
-            if j == pace_pos:
-                out.append("▎", style="bright_black")
-            elif j < fill_pos and j <= pace_pos:
-                out.append(fill_char, style=color)
-            elif j < fill_pos:
-                out.append("▒", style=color)
-            elif j < pace_pos:
-                out.append("░", style="bright_black")
-            else:
-                out.append("░", style="black")
+        if day_bar_w > 0:
+            # Up to the pace marker: fill, then unused budget
+            within = min(max(fill_pos, 0), pace_pos)
+            out.append(fill_char * within, style=color)
+            out.append("░" * (pace_pos - within), style="bright_black")
+            out.append("▎", style="bright_black")
+            # Past the marker: overspend, then the rest of the week
+            over = max(fill_pos - pace_pos - 1, 0)
+            out.append("▒" * over, style=color)
+            out.append("░" * (day_bar_w - pace_pos - 1 - over), style="black")
 
         tok_str = fmt_tokens(day.total_tokens)
         if is_est:
@@ -584,15 +634,17 @@ def build_display(
     # Daily bars need room for prefix ("  Sa    " = 8) and suffix (" 400k" = 6).
     bar_w = bar_width - 14
     out = Text()
+    # One clock reading per render keeps every bar on the same instant
+    now = datetime.now(UTC)
 
     seven_day = usage.get("seven_day")
     if seven_day and seven_day.get("resets_at"):
-        render_bucket(out, "weekly", seven_day, 7 * 24, bar_w)
+        render_bucket(out, "weekly", seven_day, 7 * 24, bar_w, now)
         out.append("\n")
 
     five_hour = usage.get("five_hour")
     if five_hour and five_hour.get("resets_at"):
-        render_bucket(out, "5-hour", five_hour, 5, bar_w)
+        render_bucket(out, "5-hour", five_hour, 5, bar_w, now)
         out.append("\n")
 
     for label, bucket in [
@@ -602,7 +654,7 @@ def build_display(
         ("oauth 7d", usage.get("seven_day_oauth_apps")),
     ]:
         if bucket and bucket.get("resets_at"):
-            render_bucket(out, label, bucket, 7 * 24, bar_w)
+            render_bucket(out, label, bucket, 7 * 24, bar_w, now)
             out.append("\n")
 
     extra = usage.get("extra_usage")
@@ -610,7 +662,7 @@ def build_display(
         render_overage(out, extra, bar_w)
 
     if show_detail and stats and seven_day and seven_day.get("resets_at"):
-        render_daily_breakdown(out, seven_day, stats, bar_w)
+        render_daily_breakdown(out, seven_day, stats, bar_w, now)
 
     return Panel(
         out,
@@ -669,6 +721,8 @@ def main(
     ] = 600,
 ) -> None:
     """Show live Claude Code usage with pacing bars."""
+    import httpx
+
     if not CREDS_PATH.exists():
         console.print("[red]No credentials at ~/.claude/.credentials.json[/red]")
         raise typer.Exit(1)
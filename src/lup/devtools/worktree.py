@@ -32,6 +32,20 @@ GITIGNORED_EXTRAS = [
 ]
 
 
+def copy_tree(src: Path, dst: Path) -> None:
+    """Copy a directory tree into dst, sharing file extents where possible.
+
+    GNU cp with --reflink=auto clones files on copy-on-write filesystems
+    (btrfs, xfs) instead of rewriting their bytes, and copies normally
+    elsewhere. Falls back to shutil where that cp is unavailable.
+    """
+    dst.mkdir(parents=True, exist_ok=True)
+    try:
+        sh.cp("-a", "--reflink=auto", f"{src}/.", str(dst), _tty_out=False)
+    except (sh.ErrorReturnCode, sh.CommandNotFound):
+        shutil.copytree(src, dst, symlinks=True, dirs_exist_ok=True)
+
+
 def branch_exists(branch: str) -> bool:
     """Check if a git branch exists (local only)."""
     try:
@@ -151,7 +165,7 @@ def create_cmd(
                 continue
             dst = worktree_path / rel_path
             if src.is_dir():
-                shutil.copytree(src, dst, symlinks=True, dirs_exist_ok=True)
+                copy_tree(src, dst)
                 typer.echo(f"Copied {rel_path}/")
             else:
                 dst.parent.mkdir(parents=True, exist_ok=True)
@@ -24,7 +24,7 @@ from typing import Annotated
 import sh
 import typer
 
-from lup.agent.config import settings
+from lup.agent.config import get_settings
 from lup.agent.core import run_agent
 from lup.agent.models import AgentSessionResult
 
@@ -62,7 +62,7 @@ async def run_session(
     Returns:
         AgentSessionResult with the agent's output and metadata.
     """
-    logger.info("Starting session with model: %s", settings.model)
+    logger.info("Starting session with model: %s", get_settings().model)
 
     result = await run_agent(
         task,
@@ -7,6 +7,7 @@ Exports:
 - ResponseCollector — response accumulator with .text and .output(T) accessors
 - build_client() — AsyncContextManager[ClaudeSDKClient] with defaults
 - query(prompt, ...) — build + query + collect; returns ResponseCollector or T
+- json_schema(model) — a model's JSON schema, generated once per class
 
 Examples:
     One-shot query (text result)::
@@ -64,6 +65,7 @@ Examples:
 import logging
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from functools import cache
 from pathlib import Path
 from typing import Literal, TypedDict, overload
 
@@ -113,6 +115,15 @@ OutputFormat = dict[str, str | JsonSchema]
 """SDK output format dict (e.g. ``{"type": "json_schema", "schema": ...}``)."""
 
 
+@cache
+def json_schema(model: type[BaseModel]) -> JsonSchema:
+    """Return ``model.model_json_schema()``, generated once per model class.
+
+    The dict is shared by every caller, so treat it as read-only.
+    """
+    return model.model_json_schema()
+
+
 # ---------------------------------------------------------------------------
 # Response collector
 # ---------------------------------------------------------------------------
@@ -135,7 +146,7 @@ class ResponseCollector:
         result = await collector.collect()
 
     After iteration, access accumulated state:
-    ``collector.blocks``, ``collector.tool_results``,
+    ``collector.blocks``, ``collector.text_parts``, ``collector.tool_results``,
     ``collector.messages``, ``collector.result``.
     """
 
@@ -147,6 +158,7 @@ class ResponseCollector:
     ) -> None:
         self.client = client
         self.blocks: list[ContentBlock] = []
+        self.text_parts: list[str] = []
         self.tool_results: list[ContentBlock] = []
         self.messages: list[AssistantMessage | UserMessage] = []
         self.result: ResultMessage | None = None
@@ -160,8 +172,7 @@ class ResponseCollector:
         Returns ``None`` when no text blocks were produced.  Access
         after ``collect()`` (called automatically by ``query()``).
         """
-        texts = [b.text for b in self.blocks if isinstance(b, TextBlock)]
-        return "\n\n".join(texts) if texts else None
+        return "\n\n".join(self.text_parts) if self.text_parts else None
 
     def output[T: BaseModel](self, output_type: type[T]) -> T | None:
         """Extract structured output as a validated Pydantic model.
@@ -181,8 +192,10 @@ class ResponseCollector:
             match message:
                 case AssistantMessage():
                     self.messages.append(message)
-                    for block in message.content:
-                        self.blocks.append(block)
+                    self.blocks.extend(message.content)
+                    self.text_parts.extend(
+                        b.text for b in message.content if isinstance(b, TextBlock)
+                    )
 
                 case ResultMessage():
                     self.result = message
@@ -195,8 +208,7 @@ class ResponseCollector:
                 case UserMessage():
                     self.messages.append(message)
                     if isinstance(message.content, list):
-                        for block in message.content:
-                            self.tool_results.append(block)
+                        self.tool_results.extend(message.content)
 
             yield message
 
@@ -360,7 +372,7 @@ async def query(
     if output_type is not None and output_format is None:
         output_format = {
             "type": "json_schema",
-            "schema": output_type.model_json_schema(),
+            "schema": json_schema(output_type),
         }
 
     async with build_client(
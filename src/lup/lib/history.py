@@ -49,10 +49,12 @@ Examples:
 
 import json
 import logging
+import os
 import re
 from collections.abc import Callable, Iterator
 from datetime import datetime
 from pathlib import Path
+from typing import TypedDict
 
 from pydantic import BaseModel, Field
 
@@ -95,6 +97,26 @@ class SessionResult[OutputT: BaseModel](BaseModel):
     outcome: str | None = Field(default=None, description="Outcome after resolution")
 
 
+class SessionFile(TypedDict, total=False):
+    """A saved :class:`SessionResult` as read back from its JSON file.
+
+    Every key is optional since older files may predate a field.
+    """
+
+    session_id: str
+    task_id: str | None
+    agent_version: str
+    timestamp: str
+    output: dict[str, object]
+    reasoning: str
+    sources_consulted: list[str]
+    duration_seconds: float | None
+    cost_usd: float | None
+    token_usage: TokenUsage | None
+    tool_metrics: MetricsSummary | None
+    outcome: str | None
+
+
 def save_session(result: BaseModel, *, session_id: str) -> Path:
     """Save a session result to disk.
 
@@ -266,12 +288,83 @@ def format_history_for_context(
 # -- Cross-version data discovery ---------------------------------------------
 
 
+def iter_subdirs(base: Path) -> Iterator[Path]:
+    """Yield the subdirectories of *base*, or nothing if it does not exist.
+
+    Uses ``os.scandir`` so the directory check reads the cached entry type
+    instead of issuing a ``stat`` per child.
+    """
+    try:
+        with os.scandir(base) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    yield Path(entry.path)
+    except FileNotFoundError:
+        return
+
+
+def latest_json(directory: Path) -> Path | None:
+    """Return the lexically last ``*.json`` file in *directory*, if any.
+
+    Session files are named by timestamp, so this is the newest one.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            latest = max(
+                (e.path for e in entries if e.name.endswith(".json") and e.is_file()),
+                default=None,
+            )
+    except FileNotFoundError:
+        return None
+    return Path(latest) if latest is not None else None
+
+
+def write_atomic(path: Path, content: str) -> None:
+    """Write *content* to *path* through a temporary file and ``os.replace``.
+
+    Readers see either the old file or the new one, never a partial write.
+    """
+    tmp = path.with_name(f"{path.name}.tmp")
+    tmp.write_text(content)
+    os.replace(tmp, path)
+
+
+class FileCache[EntryT]:
+    """A versioned JSON cache of per-file entries, keyed by file path.
+
+    A cache written under a different ``version`` loads as empty, and
+    entries for files that no longer exist are dropped on save.
+    """
+
+    def __init__(self, path: Path, version: int) -> None:
+        self.path = path
+        self.version = version
+
+    def load(self) -> dict[str, EntryT]:
+        try:
+            with open(self.path, "rb") as f:
+                cache = json.loads(f.read())
+        except (ValueError, OSError):
+            return {}
+        if not isinstance(cache, dict) or cache.get("version") != self.version:
+            return {}
+        files: dict[str, EntryT] = cache.get("files", {})
+        return files
+
+    def save(self, files: dict[str, EntryT]) -> None:
+        live = {name: entry for name, entry in files.items() if os.path.exists(name)}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(
+                self.path, json.dumps({"version": self.version, "files": live})
+            )
+        except OSError as e:
+            logger.warning("Failed to write cache %s: %s", self.path, e)
+
+
 def version_dirs() -> list[Path]:
     """Return all version directories under notes/traces/, sorted."""
-    tp = traces_path()
-    if not tp.exists():
-        return []
-    return sorted(d for d in tp.iterdir() if d.is_dir() and not d.name.startswith("."))
+    return sorted(d for d in iter_subdirs(traces_path()) if not d.name.startswith("."))
 
 
 def iter_session_dirs(
@@ -286,16 +379,12 @@ def iter_session_dirs(
 
     for ver_dir in ver_dirs:
         sessions_base = ver_dir / "sessions"
-        if not sessions_base.exists():
-            continue
         if session_id is not None:
             candidate = sessions_base / session_id
-            if candidate.exists() and candidate.is_dir():
+            if candidate.is_dir():
                 yield candidate
         else:
-            for d in sessions_base.iterdir():
-                if d.is_dir():
-                    yield d
+            yield from iter_subdirs(sessions_base)
 
 
 def iter_output_dirs(
@@ -310,16 +399,12 @@ def iter_output_dirs(
 
     for ver_dir in ver_dirs:
         outputs_base = ver_dir / "outputs"
-        if not outputs_base.exists():
-            continue
         if task_id is not None:
             candidate = outputs_base / task_id
-            if candidate.exists() and candidate.is_dir():
+            if candidate.is_dir():
                 yield candidate
         else:
-            for d in outputs_base.iterdir():
-                if d.is_dir():
-                    yield d
+            yield from iter_subdirs(outputs_base)
 
 
 def iter_trace_log_files(session_id: str | None = None) -> Iterator[Path]:
@@ -20,10 +20,16 @@ Examples:
         >>> rate_limited = Throttle(max_concurrent=1, min_interval=2.0)
         >>> async with rate_limited:
         ...     return await do_request()
+
+    Fan out a batch of queries under the cap::
+
+        >>> throttle = Throttle(max_concurrent=settings.max_concurrent_requests)
+        >>> results = await throttle.gather(query(p) for p in prompts)
 """
 
 import asyncio
 import time
+from collections.abc import Awaitable, Iterable
 from types import TracebackType
 
 
@@ -82,3 +88,18 @@ class Throttle:
         _exc_tb: TracebackType | None,
     ) -> None:
         self.get_state().semaphore.release()
+
+    async def gather[T](self, aws: Iterable[Awaitable[T]]) -> list[T | BaseException]:
+        """Await all of ``aws`` concurrently, at most max_concurrent at a time.
+
+        Results come back in input order; a failing awaitable yields its
+        exception in place instead of cancelling the rest.
+        """
+
+        async def limited(aw: Awaitable[T]) -> T:
+            async with self:
+                return await aw
+
+        return await asyncio.gather(
+            *(limited(aw) for aw in aws), return_exceptions=True
+        )
@@ -0,0 +1,61 @@
+"""Tests for the session git helpers."""
+
+from pathlib import Path
+
+import pytest
+import sh
+
+from lup.devtools.git import get_uncommitted_session_ids, git, has_staged_changes
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A git repository with one committed session, used as the working directory."""
+    monkeypatch.chdir(tmp_path)
+    git.init("--quiet")
+    git.config("user.email", "test@example.com")
+    git.config("user.name", "Test")
+    committed = tmp_path / "notes" / "traces" / "1.0.0" / "sessions" / "s0"
+    committed.mkdir(parents=True)
+    (committed / "result.json").write_text("{}")
+    (tmp_path / "README").write_text("test\n")
+    git.add(".")
+    git.commit("--quiet", "-m", "init")
+    return tmp_path
+
+
+def test_uncommitted_session_ids(repo: Path) -> None:
+    """Session IDs are parsed from both sessions/ and logs/ trace paths."""
+    assert get_uncommitted_session_ids() == set()
+
+    session = repo / "notes" / "traces" / "1.0.0" / "sessions" / "s1"
+    log = repo / "notes" / "traces" / "1.0.0" / "logs" / "s2"
+    session.mkdir(parents=True)
+    log.mkdir(parents=True)
+    (session / "result.json").write_text("{}")
+    (log / "trace.md").write_text("# trace\n")
+    (repo / "notes" / "other.md").write_text("not a session\n")
+    (repo / "notes" / "traces" / "1.0.0" / "sessions" / "s0" / "result.json").unlink()
+
+    assert get_uncommitted_session_ids() == {"s0", "s1", "s2"}
+
+
+def test_has_staged_changes(repo: Path) -> None:
+    """Only changes added to the index count as staged."""
+    assert has_staged_changes() is False
+
+    (repo / "README").write_text("changed\n")
+    assert has_staged_changes() is False
+
+    git.add("README")
+    assert has_staged_changes() is True
+
+
+def test_has_staged_changes_outside_repo(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Git failures other than 'differences found' still raise."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+    with pytest.raises(sh.ErrorReturnCode):
+        has_staged_changes()
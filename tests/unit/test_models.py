@@ -1,6 +1,7 @@
 """Tests for output models."""
 
 from lup.agent.models import AgentOutput
+from lup.lib.client import json_schema
 
 
 class TestOutputSchema:
@@ -12,4 +13,11 @@ class TestOutputSchema:
 
         assert "properties" in schema
         assert "summary" in schema["properties"]
-        assert "confidence" in schema["properties"]
\ No newline at end of file
+        assert "confidence" in schema["properties"]
+
+    def test_cached_schema_matches_generated(self) -> None:
+        """json_schema() should return one shared copy of the model schema."""
+        schema = json_schema(AgentOutput)
+
+        assert schema == AgentOutput.model_json_schema()
+        assert json_schema(AgentOutput) is schema
@@ -57,3 +57,27 @@ async def test_no_interval_is_fast() -> None:
     await asyncio.gather(*[work() for _ in range(5)])
     elapsed = time.monotonic() - start
     assert elapsed < 0.1
+
+
+@pytest.mark.asyncio
+async def test_gather_limits_and_keeps_order() -> None:
+    """gather() respects max_concurrent and returns results in input order."""
+    throttle = Throttle(max_concurrent=2)
+    active = 0
+    max_active = 0
+
+    async def work(i: int) -> int:
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        await asyncio.sleep(0.01 * (5 - i))
+        active -= 1
+        if i == 3:
+            raise ValueError(i)
+        return i
+
+    results = await throttle.gather(work(i) for i in range(5))
+    assert max_active <= 2
+    assert results[:3] == [0, 1, 2]
+    assert isinstance(results[3], ValueError)
+    assert results[4] == 4